@@ -9,10 +9,14 @@ This plugin serves as a reference implementation showing:
 - Contributing profiles from plugins
 """
 
+import logging
 import click
 from typing import Dict, Any
 from mxx.plugin_system.plugin import MxxPlugin
 
+# Hook chatter goes through logging so it costs nothing when DEBUG is off
+logger = logging.getLogger("mxxp.example")
+
 
 class ExamplePlugin(MxxPlugin):
     """Example plugin demonstrating all available plugin capabilities."""
@@ -34,13 +38,26 @@ class ExamplePlugin(MxxPlugin):
         - Validation checks
         - Early exit conditions (like single-instance check)
         """
-        click.echo("[ExamplePlugin] Initialized!")
+        logger.debug("[ExamplePlugin] Initialized!")
         # Example: You could check prerequisites here
         # if not check_requirements():
         #     sys.exit(1)
     
     # ==================== CLI Command Registration ====================
     
+    # Command groups: name -> help text
+    GROUPS = {
+        "demo": "Demo command group from plugin.",
+    }
+    
+    # Commands: (group or None for top level, name, method name, params)
+    COMMANDS = (
+        (None, "example", "_cmd_example",
+         (click.Option(["--verbose", "-v"], is_flag=True, help="Verbose output"),)),
+        ("demo", "info", "_cmd_info", ()),
+        ("demo", "echo", "_cmd_echo", (click.Argument(["message"]),)),
+    )
+    
     def register_commands(self, cli_group) -> None:
         """Register custom CLI commands.
         
@@ -51,33 +68,37 @@ class ExamplePlugin(MxxPlugin):
         - New top-level commands
         - Command groups
         - Subcommands
-        """
-        
-        @cli_group.command()
-        @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-        def example(verbose):
-            """Example command added by plugin."""
-            click.echo("Hello from ExamplePlugin command!")
-            if verbose:
-                click.echo(f"Commands executed: {self.command_count}")
-                click.echo(f"Profiles run: {self.profile_runs}")
         
-        @cli_group.group()
-        def demo():
-            """Demo command group from plugin."""
-            pass
+        Commands are built straight from the COMMANDS table instead of
+        stacking decorators; the help text comes from each method's docstring.
+        """
+        from mxx.cli.plugin_aware import PluginAwareCommand, PluginAwareGroup
         
-        @demo.command()
-        def info():
-            """Show plugin info."""
-            click.echo("ExamplePlugin v0.1.0")
-            click.echo("Demonstrates all plugin capabilities")
+        groups = {}
+        for name, help_text in self.GROUPS.items():
+            groups[name] = PluginAwareGroup(name, help=help_text)
+            cli_group.add_command(groups[name])
         
-        @demo.command()
-        @click.argument("message")
-        def echo(message):
-            """Echo a message."""
-            click.echo(f"[ExamplePlugin] {message}")
+        for group_name, name, method_name, params in self.COMMANDS:
+            callback = getattr(self, method_name)
+            command = PluginAwareCommand(name, callback=callback, params=list(params), help=callback.__doc__)
+            (groups[group_name] if group_name else cli_group).add_command(command)
+    
+    def _cmd_example(self, verbose):
+        """Example command added by plugin."""
+        click.echo("Hello from ExamplePlugin command!")
+        if verbose:
+            click.echo(f"Commands executed: {self.command_count}")
+            click.echo(f"Profiles run: {self.profile_runs}")
+    
+    def _cmd_info(self):
+        """Show plugin info."""
+        click.echo("ExamplePlugin v0.1.0")
+        click.echo("Demonstrates all plugin capabilities")
+    
+    def _cmd_echo(self, message):
+        """Echo a message."""
+        click.echo(f"[ExamplePlugin] {message}")
     
     # ==================== Command Execution Hooks ====================
     
@@ -95,16 +116,20 @@ class ExamplePlugin(MxxPlugin):
         - Early exits
         """
         self.command_count += 1
-        click.echo(f"[ExamplePlugin] Pre-command: {command_name}")
+        logger.debug("[ExamplePlugin] Pre-command: %s", command_name)
+        
+        # Skip inspecting the context entirely unless someone will see it
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         
         # Access command parameters
         if ctx.params:
-            click.echo(f"[ExamplePlugin] Parameters: {ctx.params}")
+            logger.debug("[ExamplePlugin] Parameters: %s", ctx.params)
         
         # Access plugin loader from context
         plugin_loader = ctx.obj.get('plugin_loader') if ctx.obj else None
         if plugin_loader:
-            click.echo(f"[ExamplePlugin] {len(plugin_loader.plugins)} plugins loaded")
+            logger.debug("[ExamplePlugin] %d plugins loaded", len(plugin_loader.plugins))
     
     def hook_post_command(self, command_name: str, ctx: click.Context, result: Any) -> None:
         """Hook called after successful command execution.
@@ -120,7 +145,7 @@ class ExamplePlugin(MxxPlugin):
         - Metrics collection
         - Post-processing
         """
-        click.echo(f"[ExamplePlugin] Post-command: {command_name} completed successfully")
+        logger.debug("[ExamplePlugin] Post-command: %s completed successfully", command_name)
     
     def hook_command_error(self, command_name: str, ctx: click.Context, error: Exception) -> None:
         """Hook called when command execution fails.
@@ -136,7 +161,7 @@ class ExamplePlugin(MxxPlugin):
         - Cleanup after failures
         - Notifications
         """
-        click.echo(f"[ExamplePlugin] Command error in {command_name}: {error}")
+        logger.debug("[ExamplePlugin] Command error in %s: %s", command_name, error)
     
     # ==================== Profile Execution Hooks ====================
     
@@ -154,15 +179,18 @@ class ExamplePlugin(MxxPlugin):
         - Precondition checks
         """
         self.profile_runs += 1
-        click.echo(f"[ExamplePlugin] Starting profile: {profile.name if hasattr(profile, 'name') else 'unknown'}")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("[ExamplePlugin] Starting profile: %s", getattr(profile, 'name', 'unknown'))
         
         # Access LD configuration
         if profile.ld:
-            click.echo(f"[ExamplePlugin] LD index: {profile.ld.index}, name: {profile.ld.name}")
+            logger.debug("[ExamplePlugin] LD index: %s, name: %s", profile.ld.index, profile.ld.name)
         
         # Access MAA configuration
         if profile.maa:
-            click.echo(f"[ExamplePlugin] MAA path: {profile.maa.path}")
+            logger.debug("[ExamplePlugin] MAA path: %s", profile.maa.path)
     
     def post_profile_start(self, profile, ctx: Dict[str, Any]) -> None:
         """Hook called after a profile starts.
@@ -176,7 +204,7 @@ class ExamplePlugin(MxxPlugin):
         - Post-start validation
         - Triggering dependent actions
         """
-        click.echo("[ExamplePlugin] Profile started successfully")
+        logger.debug("[ExamplePlugin] Profile started successfully")
     
     def pre_profile_kill(self, profile, ctx: Dict[str, Any]) -> None:
         """Hook called before a profile is killed.
@@ -190,7 +218,7 @@ class ExamplePlugin(MxxPlugin):
         - Saving state
         - Notifications
         """
-        click.echo("[ExamplePlugin] Killing profile...")
+        logger.debug("[ExamplePlugin] Killing profile...")
     
     def post_profile_kill(self, profile, ctx: Dict[str, Any]) -> None:
         """Hook called after a profile is killed.
@@ -204,7 +232,7 @@ class ExamplePlugin(MxxPlugin):
         - Resource release
         - Logging termination
         """
-        click.echo("[ExamplePlugin] Profile killed")
+        logger.debug("[ExamplePlugin] Profile killed")
     
     # ==================== Profile Validation Hooks ====================
     
@@ -228,14 +256,14 @@ class ExamplePlugin(MxxPlugin):
         """
         # Example: Check if test mode
         if ctx.get('test_mode'):
-            click.echo("[ExamplePlugin] Test mode - allowing run")
+            logger.debug("[ExamplePlugin] Test mode - allowing run")
             return True
         
         # Example: Validate time windows
         # from datetime import datetime
         # hour = datetime.now().hour
         # if hour < 6 or hour > 23:
-        #     click.echo("[ExamplePlugin] Outside allowed hours")
+        #     logger.debug("[ExamplePlugin] Outside allowed hours")
         #     return False
         
         return True
@@ -301,18 +329,18 @@ class ExamplePlugin(MxxPlugin):
         
         Note: Implement hook_{event_name} methods to handle specific events
         """
-        # This is already implemented in PluginInterface
-        # But you can override for custom behavior
+        # This is already implemented in PluginInterface (signatures are
+        # cached there), but you can override for custom behavior
         return super().hook(hook_name, *args, **kwargs)
     
     # Example custom hooks (called via emit())
     def hook_pre_ld_start(self, profile):
         """Example custom hook for LD start."""
-        click.echo("[ExamplePlugin] Custom hook: pre_ld_start")
+        logger.debug("[ExamplePlugin] Custom hook: pre_ld_start")
     
     def hook_pre_maa_launch(self, profile):
         """Example custom hook for MAA launch."""
-        click.echo("[ExamplePlugin] Custom hook: pre_maa_launch")
+        logger.debug("[ExamplePlugin] Custom hook: pre_maa_launch")
 
 
 # Plugin instance - REQUIRED
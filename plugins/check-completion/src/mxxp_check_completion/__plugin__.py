@@ -6,11 +6,31 @@ a JSON file stored in ~/.mxx/completion/{date}.json.
 
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 from mxx.plugin_system.plugin import MxxPlugin
-from .manager import CompletionManager
-from .commands import register_next_command, register_notify_command
+
+if TYPE_CHECKING:
+    from .manager import CompletionManager
+
+
+_COMPLETION_DIR = Path.home() / ".mxx" / "completion"
+
+
+def _parse_flags(vars: Dict[str, str]) -> Tuple[bool, bool, bool]:
+    """Read the completion flags from --var values.
+    
+    Args:
+        vars: Variables from --var options
+        
+    Returns:
+        Tuple of (by_completion, include_failed, reset_completion)
+    """
+    return (
+        vars.get('by-completion') == 'true',
+        vars.get('include-failed') == 'true',
+        vars.get('reset-completion') == 'true',
+    )
 
 
 class CheckCompletionPlugin(MxxPlugin):
@@ -19,8 +39,15 @@ class CheckCompletionPlugin(MxxPlugin):
     def __init__(self):
         """Initialize the plugin."""
         super().__init__()
-        completion_dir = Path.home() / ".mxx" / "completion"
-        self.manager = CompletionManager(completion_dir)
+        self._manager: Optional["CompletionManager"] = None
+    
+    @property
+    def manager(self) -> "CompletionManager":
+        """Lazily create the completion manager on first use."""
+        if self._manager is None:
+            from .manager import CompletionManager
+            self._manager = CompletionManager(_COMPLETION_DIR)
+        return self._manager
     
     def pre_profile_start(self, profile, ctx: Dict[str, Any]) -> None:
         """Check completion before profile starts and exit if already completed.
@@ -29,30 +56,30 @@ class CheckCompletionPlugin(MxxPlugin):
             profile: Profile being started
             ctx: Runtime context (contains 'profile_name' and 'vars')
         """
-        vars = ctx.get('vars', {})
-        profile_name = ctx.get('profile_name')
+        by_completion, include_failed, reset_completion = _parse_flags(ctx.get('vars', {}))
         
+        # Nothing to do (and no file I/O) unless one of our flags is set
+        if not (by_completion or reset_completion):
+            return
+        
+        profile_name = ctx.get('profile_name')
         if not profile_name:
             return
         
         # Handle reset-completion flag
-        if vars.get('reset-completion') == 'true':
+        if reset_completion:
             if self.manager.reset_completion(profile_name):
                 print(f"[CheckCompletion] Reset completion status for '{profile_name}'.")
             else:
                 print(f"[CheckCompletion] Profile '{profile_name}' was not marked as completed.")
         
         # Only check/track completion if --var by-completion is passed
-        if vars.get('by-completion') != 'true':
+        if not by_completion:
             return
         
-        # Check if include-failed option is set
-        include_failed = vars.get('include-failed') == 'true'
-        
         # Check if already completed today
-        if self.manager.is_completed(profile_name, include_failed=include_failed):
-            completions = self.manager.load_completions()
-            status = completions.get(profile_name)
+        status = self.manager.load_completions().get(profile_name)
+        if status is True or (include_failed and status is not None):
             status_text = "successfully" if status else "with failure"
             
             print(f"[CheckCompletion] Profile '{profile_name}' already completed today {status_text}.")
@@ -74,10 +101,10 @@ class CheckCompletionPlugin(MxxPlugin):
             profile: Profile that was started
             ctx: Runtime context (contains 'profile_name', 'vars', and 'profile_failed')
         """
-        vars = ctx.get('vars', {})
+        by_completion, _, _ = _parse_flags(ctx.get('vars', {}))
         
         # Only track if --var by-completion=true is passed
-        if vars.get('by-completion') != 'true':
+        if not by_completion:
             return
         
         profile_name = ctx.get('profile_name')
@@ -103,10 +130,6 @@ class CheckCompletionPlugin(MxxPlugin):
             print(f"[CheckCompletion] Marked '{profile_name}' as failed for today.")
         else:
             print(f"[CheckCompletion] Marked '{profile_name}' as completed successfully for today.")
-        if failed:
-            print(f"[CheckCompletion] Marked '{profile_name}' as failed for today.")
-        else:
-            print(f"[CheckCompletion] Marked '{profile_name}' as completed successfully for today.")
     
     def register_commands(self, cli_group):
         """Register custom CLI commands.
@@ -118,12 +141,13 @@ class CheckCompletionPlugin(MxxPlugin):
         """
         # Import here to avoid issues during plugin discovery
         from mxx.cli.run import run
+        from .commands import register_next_command, register_notify_command
         
         # Register 'next' command under the 'run' group
-        register_next_command(run, self.manager)
+        register_next_command(run, lambda: self.manager)
         
         # Register 'notify' command under the main CLI group
-        register_notify_command(cli_group, self.manager)
+        register_notify_command(cli_group, lambda: self.manager)
 
 
 plugin = CheckCompletionPlugin()
@@ -1,18 +1,68 @@
 """CLI commands for completion tracking."""
 
+import json
+import os
+from collections import ChainMap
 import click
-from typing import TYPE_CHECKING
+from typing import Callable, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from mxx.core.profile_resolver import ProfileResolver
     from .manager import CompletionManager
 
+# MXX_QUIET=1 silences the informational output of 'run next' for scripts
+_VERBOSE = os.environ.get('MXX_QUIET') != '1'
 
-def register_notify_command(cli_group, manager: "CompletionManager"):
+
+def _cached_list_profiles(profile_resolver: "ProfileResolver") -> List[str]:
+    """List profile names, reusing the last result while configs are unchanged.
+    
+    Listing profiles parses every config file. The result is stored in
+    {config_dir}/cache/profiles.json together with the name, mtime and size
+    of each .toml file and the names of plugin-provided profiles, and is
+    reused as long as all of those still match.
+    
+    Args:
+        profile_resolver: Resolver used to list profiles on a cache miss
+        
+    Returns:
+        Sorted list of profile names
+    """
+    from mxx.core.config import get_config_path, get_profile_path
+    from .manager import _write_json_atomic
+    
+    files = []
+    with os.scandir(get_profile_path()) as entries:
+        for entry in entries:
+            if entry.name.endswith('.toml') and entry.is_file():
+                stat = entry.stat()
+                files.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    files.sort()
+    key = {'files': files, 'plugins': sorted(profile_resolver.plugin_loader.load_plugin_profile_names())}
+    
+    cache_file = get_config_path() / "cache" / "profiles.json"
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if cached['key'] == key:
+            return cached['profiles']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    profiles = profile_resolver.list_profiles()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(cache_file, {'key': key, 'profiles': profiles})
+    except OSError:
+        pass
+    return profiles
+
+
+def register_notify_command(cli_group, get_manager: Callable[[], "CompletionManager"]):
     """Register the 'notify' command under the main CLI group.
     
     Args:
         cli_group: The main Click CLI group
-        manager: CompletionManager instance
+        get_manager: Callable returning the CompletionManager instance
     """
     @cli_group.command(name='notify')
     @click.argument('profile', required=True)
@@ -36,6 +86,7 @@ def register_notify_command(cli_group, manager: "CompletionManager"):
         Args:
             profile: Name of the profile to add to notify list
         """
+        manager = get_manager()
         manager.add_to_notify_list(profile)
         notify_file = manager.get_notify_file()
         notify_list = manager.load_notify_list()
@@ -45,12 +96,12 @@ def register_notify_command(cli_group, manager: "CompletionManager"):
         click.echo(f"[CheckCompletion] Current notify list: {', '.join(notify_list)}")
 
 
-def register_next_command(run_group, manager: "CompletionManager"):
+def register_next_command(run_group, get_manager: Callable[[], "CompletionManager"]):
     """Register the 'next' command under the run group.
     
     Args:
         run_group: The Click run command group
-        manager: CompletionManager instance
+        get_manager: Callable returning the CompletionManager instance
     """
     @run_group.command(name='next')
     def run_next():
@@ -78,7 +129,7 @@ def register_next_command(run_group, manager: "CompletionManager"):
         
         # Get all available profiles
         try:
-            all_profiles = profile_resolver.list_profiles()
+            all_profiles = _cached_list_profiles(profile_resolver)
         except Exception as e:
             click.echo(f"[CheckCompletion] Error discovering profiles: {e}", err=True)
             return
@@ -88,7 +139,7 @@ def register_next_command(run_group, manager: "CompletionManager"):
             return
         
         # Get incomplete profiles
-        incomplete = manager.get_incomplete_profiles(all_profiles)
+        incomplete = get_manager().get_incomplete_profiles(all_profiles)
         
         if not incomplete:
             click.echo(f"[CheckCompletion] All {len(all_profiles)} profiles already completed today.")
@@ -96,17 +147,17 @@ def register_next_command(run_group, manager: "CompletionManager"):
         
         # Run the first incomplete profile
         next_profile = incomplete[0]
-        click.echo(f"[CheckCompletion] Found {len(incomplete)} incomplete profiles out of {len(all_profiles)} total.")
-        click.echo(f"[CheckCompletion] Running next incomplete profile: {next_profile}")
-        if len(incomplete) > 1:
-            click.echo(f"[CheckCompletion] Remaining: {', '.join(incomplete[1:])}")
+        if _VERBOSE:
+            click.echo(f"[CheckCompletion] Found {len(incomplete)} incomplete profiles out of {len(all_profiles)} total.")
+            click.echo(f"[CheckCompletion] Running next incomplete profile: {next_profile}")
+            if len(incomplete) > 1:
+                click.echo(f"[CheckCompletion] Remaining: {', '.join(incomplete[1:])}")
         
-        # Set the by-completion var in context
-        current_context = profile_resolver.plugin_loader.context.copy()
-        current_vars = current_context.get('vars', {})
-        current_vars['by-completion'] = 'true'
-        current_context['vars'] = current_vars
-        profile_resolver.plugin_loader.set_context(current_context)
+        # Set the by-completion var in context; only the vars are rebuilt, the
+        # rest of the context is layered underneath without being copied
+        base_context = profile_resolver.plugin_loader.context
+        run_vars = {**base_context.get('vars', {}), 'by-completion': 'true'}
+        profile_resolver.plugin_loader.set_context(ChainMap({'vars': run_vars}, base_context))
         
         # Invoke up command with kill flag
         ctx = click.get_current_context()
@@ -1,9 +1,87 @@
-"""Completion tracking storage manager."""
+"""Completion tracking storage manager.
+
+Records are partitioned by day: ``{date}.json`` maps profile names to their
+success flag and ``{date}.notify.json`` lists profiles in the notify list.
+Each lookup only touches the file for the requested date, so cost depends on
+the number of profiles run that day rather than on the total history.
+"""
 
 import json
+import os
+import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@contextmanager
+def _file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a sidecar file while the block runs.
+    
+    Args:
+        lock_path: Path to the lock file (created if missing)
+    """
+    with open(lock_path, 'a+') as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file in one shot, using orjson when installed.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        Parsed JSON data
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write compact JSON to a synced temp file and swap it into place.
+    
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(",", ":")).encode()
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 class CompletionManager:
@@ -16,12 +94,47 @@ class CompletionManager:
             completion_dir: Directory to store completion files
         """
         self.completion_dir = completion_dir
+        # Parsed completion files as (mtime_ns, records), reused while unchanged
+        self._cache: Dict[Path, Tuple[int, Dict[str, bool]]] = {}
+        # Today's file paths, recomputed only once the next local midnight passes
+        self._today_expires: float = 0.0
+        self._today_file: Optional[Path] = None
+        self._today_notify_file: Optional[Path] = None
         self._ensure_completion_dir()
     
     def _ensure_completion_dir(self) -> None:
         """Ensure the completion directory exists."""
         self.completion_dir.mkdir(parents=True, exist_ok=True)
     
+    def _locked(self):
+        """Lock the completion directory against concurrent writers."""
+        return _file_lock(self.completion_dir / ".lock")
+    
+    def _refresh_today(self) -> None:
+        """Recompute today's file paths if the date has changed."""
+        now = time.time()
+        if now < self._today_expires:
+            return
+        today = datetime.fromtimestamp(now).date()
+        date = today.strftime("%Y-%m-%d")
+        self._today_file = self.completion_dir / f"{date}.json"
+        self._today_notify_file = self.completion_dir / f"{date}.notify.json"
+        self._today_expires = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+    
+    def _remember(self, completion_file: Path, completions: Dict[str, bool]) -> None:
+        """Cache completions just written to disk.
+        
+        Args:
+            completion_file: File the completions were written to
+            completions: Completion records that were written
+        """
+        try:
+            mtime = completion_file.stat().st_mtime_ns
+        except OSError:
+            self._cache.pop(completion_file, None)
+            return
+        self._cache[completion_file] = (mtime, dict(completions))
+    
     def get_completion_file(self, date: Optional[str] = None) -> Path:
         """Get the completion file path for a specific date.
         
@@ -32,7 +145,8 @@ class CompletionManager:
             Path to the completion JSON file
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            self._refresh_today()
+            return self._today_file
         return self.completion_dir / f"{date}.json"
     
     def get_notify_file(self, date: Optional[str] = None) -> Path:
@@ -45,7 +159,8 @@ class CompletionManager:
             Path to the notify JSON file
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            self._refresh_today()
+            return self._today_notify_file
         return self.completion_dir / f"{date}.notify.json"
     
     def load_completions(self, date: Optional[str] = None) -> Dict[str, bool]:
@@ -57,14 +172,56 @@ class CompletionManager:
         Returns:
             Dictionary mapping profile names to completion status
         """
-        completion_file = self.get_completion_file(date)
-        if completion_file.exists():
-            try:
-                with open(completion_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+        return self._read_completions(self.get_completion_file(date))
+    
+    def _read_completions(self, completion_file: Path) -> Dict[str, bool]:
+        """Read completion records from disk, reusing the cache when unchanged.
+        
+        Args:
+            completion_file: Completion file to read
+            
+        Returns:
+            Dictionary mapping profile names to completion status
+        """
+        try:
+            mtime = completion_file.stat().st_mtime_ns
+        except OSError:
+            return {}
+        
+        cached = self._cache.get(completion_file)
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
+        
+        try:
+            completions = _read_json(completion_file)
+        except (ValueError, IOError):
+            return {}
+        
+        self._cache[completion_file] = (mtime, completions)
+        return dict(completions)
+    
+    def _update_completion(self, completion_file: Path, profile_name: str, status: Optional[bool]) -> None:
+        """Write one profile's status to a completion file.
+        
+        The file is re-read under the directory lock so that changes made by
+        other processes since it was last loaded are kept.
+        
+        Args:
+            completion_file: Completion file to update
+            profile_name: Name of the profile
+            status: New status, or None to remove the profile
+        """
+        try:
+            with self._locked():
+                completions = self._read_completions(completion_file)
+                if status is None:
+                    completions.pop(profile_name, None)
+                else:
+                    completions[profile_name] = status
+                _write_json_atomic(completion_file, completions)
+            self._remember(completion_file, completions)
+        except IOError as e:
+            print(f"[CheckCompletion] Warning: Could not save completion: {e}")
     
     def save_completion(self, profile_name: str, success: bool = True, date: Optional[str] = None) -> None:
         """Save completion status for a profile.
@@ -74,15 +231,7 @@ class CompletionManager:
             success: True if successful, False if failed
             date: Date string (YYYY-MM-DD), defaults to today
         """
-        completions = self.load_completions(date)
-        completions[profile_name] = success
-        
-        completion_file = self.get_completion_file(date)
-        try:
-            with open(completion_file, 'w') as f:
-                json.dump(completions, f, indent=2)
-        except IOError as e:
-            print(f"[CheckCompletion] Warning: Could not save completion: {e}")
+        self._update_completion(self.get_completion_file(date), profile_name, success)
     
     def is_completed(self, profile_name: str, include_failed: bool = False, date: Optional[str] = None) -> bool:
         """Check if a profile has been completed.
@@ -116,18 +265,10 @@ class CompletionManager:
         Returns:
             True if profile was reset, False if not found
         """
-        completions = self.load_completions(date)
-        if profile_name in completions:
-            del completions[profile_name]
-            completion_file = self.get_completion_file(date)
-            try:
-                with open(completion_file, 'w') as f:
-                    json.dump(completions, f, indent=2)
-                return True
-            except IOError as e:
-                print(f"[CheckCompletion] Warning: Could not reset completion: {e}")
-                return False
-        return False
+        if profile_name not in self.load_completions(date):
+            return False
+        self._update_completion(self.get_completion_file(date), profile_name, None)
+        return True
     
     def get_incomplete_profiles(self, all_profiles: List[str], include_failed: bool = False, date: Optional[str] = None) -> List[str]:
         """Get list of profiles that haven't been completed.
@@ -145,21 +286,11 @@ class CompletionManager:
         """
         completions = self.load_completions(date)
         
-        # Separate profiles into never-run and failed
-        never_run = []
-        failed = []
-        
-        for profile in all_profiles:
-            if self.is_completed(profile, include_failed=include_failed, date=date):
-                continue
-            
-            status = completions.get(profile)
-            if status is False:
-                # Profile failed previously
-                failed.append(profile)
-            else:
-                # Profile never run or no record
-                never_run.append(profile)
+        # Profiles with no record have never run; failed ones only count as
+        # incomplete unless failures are included
+        failed_set = set() if include_failed else {p for p, v in completions.items() if v is False}
+        never_run = [p for p in all_profiles if p not in completions]
+        failed = [p for p in all_profiles if p in failed_set]
         
         # Return never-run profiles first, failed profiles last
         return never_run + failed
@@ -176,12 +307,11 @@ class CompletionManager:
         notify_file = self.get_notify_file(date)
         if notify_file.exists():
             try:
-                with open(notify_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        return data
-                    return []
-            except (json.JSONDecodeError, IOError):
+                data = _read_json(notify_file)
+                if isinstance(data, list):
+                    return data
+                return []
+            except (ValueError, IOError):
                 return []
         return []
     
@@ -192,14 +322,13 @@ class CompletionManager:
             profile_name: Name of the profile to add
             date: Date string (YYYY-MM-DD), defaults to today
         """
-        notify_list = self.load_notify_list(date)
-        if profile_name not in notify_list:
-            notify_list.append(profile_name)
-        
         notify_file = self.get_notify_file(date)
         try:
-            with open(notify_file, 'w') as f:
-                json.dump(notify_list, f, indent=2)
+            with self._locked():
+                notify_list = self.load_notify_list(date)
+                if profile_name not in notify_list:
+                    notify_list.append(profile_name)
+                _write_json_atomic(notify_file, notify_list)
         except IOError as e:
             print(f"[CheckCompletion] Warning: Could not save notify list: {e}")
     
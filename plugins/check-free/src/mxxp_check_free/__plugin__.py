@@ -1,7 +1,38 @@
 import ctypes
+import sys
+import time
 from ctypes import wintypes
 from mxx.plugin_system.plugin import MxxPlugin
 
+
+class _LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", wintypes.UINT), ("dwTime", wintypes.DWORD)]
+
+
+# Bind the input API once with explicit prototypes so the polling loop skips
+# the windll attribute lookup and argument guessing on every sample
+if sys.platform == "win32":
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _GetAsyncKeyState = _user32.GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = ctypes.c_short
+    _GetLastInputInfo = _user32.GetLastInputInfo
+    _GetLastInputInfo.argtypes = [ctypes.POINTER(_LASTINPUTINFO)]
+    _GetLastInputInfo.restype = wintypes.BOOL
+    _GetTickCount = ctypes.WinDLL('kernel32').GetTickCount
+    _GetTickCount.restype = wintypes.DWORD
+else:
+    _GetAsyncKeyState = None
+    _GetLastInputInfo = None
+    _GetTickCount = None
+
+
+# Users idle for at least this long are not sampled at all
+_IDLE_SKIP_MS = 2000
+
+# Mouse buttons sampled for activity (Left=0x01, Right=0x02)
+_BUTTONS = (0x01, 0x02)
+
 class CheckFreePlugin(MxxPlugin):
     def canRunProfile(self, profile, ctx) -> bool:
         if "x" in ctx:
@@ -20,33 +51,57 @@ class CheckFreePlugin(MxxPlugin):
         return True
 
     def _is_user_very_active(self, threshold_clicks=10, duration_seconds=10) -> bool:
-        """Monitor mouse clicks for a duration to see if activity exceeds threshold."""
-        import time
+        """Monitor mouse clicks for a duration to see if activity exceeds threshold.
+        
+        Returns immediately when there has been no input for the last two
+        seconds. Otherwise samples every 50 ms until the first click, then every 16 ms so fast
+        click bursts are not missed. Sleeps follow a fixed tick schedule and
+        never overrun the deadline.
+        """
+        if _GetAsyncKeyState is None:
+            return False
+        
+        # No input recently: skip the blocking sampling entirely
+        idle_ms = self._idle_ms()
+        if idle_ms is not None and idle_ms >= _IDLE_SKIP_MS:
+            return False
         
-        start_time = time.time()
         clicks = 0
-        # Track previous state of buttons (Left=0x01, Right=0x02)
-        was_down = {0x01: False, 0x02: False}
+        # Track previous state of each button
+        was_down = [False] * len(_BUTTONS)
+        interval = 0.05
         
         print(f"CheckFree: Monitoring user activity for {duration_seconds}s...")
         
-        while (time.time() - start_time) < duration_seconds:
-            for btn in [0x01, 0x02]:
+        next_tick = time.monotonic()
+        deadline = next_tick + duration_seconds
+        while next_tick < deadline:
+            for i, btn in enumerate(_BUTTONS):
                 # Check if key is currently down (MSB set)
-                is_down = (ctypes.windll.user32.GetAsyncKeyState(btn) & 0x8000) != 0
+                is_down = (_GetAsyncKeyState(btn) & 0x8000) != 0
                 
-                if is_down and not was_down[btn]:
+                if is_down and not was_down[i]:
                     clicks += 1
+                    interval = 0.016
                 
-                was_down[btn] = is_down
+                was_down[i] = is_down
             
             if clicks >= threshold_clicks:
                 return True
             
-            time.sleep(0.05)
+            next_tick = min(next_tick + interval, deadline)
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             
         return False
 
+    def _idle_ms(self):
+        """Milliseconds since the last keyboard or mouse input, or None if unknown."""
+        info = _LASTINPUTINFO(cbSize=ctypes.sizeof(_LASTINPUTINFO))
+        if not _GetLastInputInfo(ctypes.byref(info)):
+            return None
+        # Both values are 32-bit tick counts that wrap every ~49.7 days
+        return (_GetTickCount() - info.dwTime) & 0xFFFFFFFF
+
     def _is_fullscreen_app_running(self) -> bool:
         """Check if the foreground window is fullscreen."""
         try:
@@ -2,12 +2,89 @@
 
 import sys
 import os
-import psutil
 import click
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from mxx.plugin_system.plugin import MxxPlugin
 
 
+def _snapshot_processes() -> Dict[int, Tuple[int, str]]:
+    """Take a single snapshot of running processes.
+    
+    On Windows this reads one Toolhelp snapshot directly, which yields PID,
+    parent PID and executable name without opening any process. Elsewhere
+    psutil is used with only 'pid', 'ppid' and 'name' requested.
+    
+    Returns:
+        Dictionary mapping PID to (parent PID, process name)
+    """
+    if sys.platform == "win32":
+        return _snapshot_processes_win32()
+    
+    # Imported here so commands outside the run group never load psutil
+    import psutil
+    
+    processes = {}
+    for proc in psutil.process_iter(['pid', 'ppid', 'name']):
+        try:
+            info = proc.info
+            processes[info['pid']] = (info['ppid'], info['name'])
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return processes
+
+
+def _snapshot_processes_win32() -> Dict[int, Tuple[int, str]]:
+    """Read PID, parent PID and name of every process from a Toolhelp snapshot.
+    
+    Returns:
+        Dictionary mapping PID to (parent PID, process name)
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+    
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    
+    processes = {}
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        return processes
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            processes[entry.th32ProcessID] = (entry.th32ParentProcessID, entry.szExeFile)
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return processes
+
+
 class CheckSingleInstancePlugin(MxxPlugin):
     """Ensures only one instance of MXX is running at a time."""
     
@@ -23,39 +100,42 @@ class CheckSingleInstancePlugin(MxxPlugin):
         if ctx and not self._is_run_group(ctx):
             return
         
-        # Get current process and walk up to find mxx.exe if we're a child process
-        current = psutil.Process()
-        current_mxx_pid = None
+        other_pid = self._find_other_instance()
+        if other_pid is not None:
+            print(f"CheckSingleInstance: Found another MXX instance running (PID {other_pid}).")
+            print("CheckSingleInstance: Only one instance of MXX is allowed. Exiting...")
+            sys.exit(1)
+    
+    def _find_other_instance(self) -> Optional[int]:
+        """Find an mxx.exe process other than the one we belong to.
+        
+        Returns:
+            PID of the first other mxx.exe found, or None
+        """
+        # One process snapshot serves both the ancestry walk and the scan
+        processes = _snapshot_processes()
         
         # Check if current process is mxx.exe or find parent mxx.exe
-        while current:
-            try:
-                if current.name() == 'mxx.exe':
-                    current_mxx_pid = current.pid
-                    break
-                current = current.parent()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+        current_mxx_pid = None
+        pid = os.getpid()
+        seen = set()
+        while pid in processes and pid not in seen:
+            seen.add(pid)
+            parent_pid, name = processes[pid]
+            if name == 'mxx.exe':
+                current_mxx_pid = pid
                 break
+            pid = parent_pid
         
         # If we couldn't find our own mxx.exe parent, use current PID as fallback
         if current_mxx_pid is None:
             current_mxx_pid = os.getpid()
         
-        mxx_processes = []
-        
-        # Find all mxx.exe processes excluding ourselves
-        for proc in psutil.process_iter(['pid', 'name', 'username']):
-            try:
-                if proc.info['name'] == 'mxx.exe' and proc.info['pid'] != current_mxx_pid:
-                    mxx_processes.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        
-        # Exit if other instances found
-        if mxx_processes:
-            print(f"CheckSingleInstance: Found {len(mxx_processes)} other MXX instance(s) running.")
-            print("CheckSingleInstance: Only one instance of MXX is allowed. Exiting...")
-            sys.exit(1)
+        # Stop at the first other instance
+        for pid, (_, name) in processes.items():
+            if name == 'mxx.exe' and pid != current_mxx_pid:
+                return pid
+        return None
     
     def _is_run_group(self, ctx: click.Context) -> bool:
         """Check if context is within the run command group.
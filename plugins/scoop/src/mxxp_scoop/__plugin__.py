@@ -1,9 +1,48 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 
 from mxx.plugin_system.plugin import MxxPlugin
-from mxx.models.profile import MxxProfile
+
+if TYPE_CHECKING:
+    from mxx.models.profile import MxxProfile
+
+
+def _scoop_apps_dirs() -> tuple[Path, ...]:
+    """Candidate Scoop ``apps`` directories, in lookup order."""
+    dirs = []
+    # 1. SCOOP environment variable
+    scoop_root = os.environ.get("SCOOP")
+    if scoop_root:
+        dirs.append(Path(scoop_root) / "apps")
+    # 2. Default user scoop directory (~/scoop)
+    dirs.append(Path.home() / "scoop" / "apps")
+    # 3. Global scoop directory (ProgramData/scoop)
+    program_data = os.environ.get("ProgramData", "C:\\ProgramData")
+    dirs.append(Path(program_data) / "scoop" / "apps")
+    # 4. SCOOP_GLOBAL environment variable
+    scoop_global = os.environ.get("SCOOP_GLOBAL")
+    if scoop_global:
+        dirs.append(Path(scoop_global) / "apps")
+    return tuple(dirs)
+
+
+_APPS_DIRS = _scoop_apps_dirs()
+
+
+@lru_cache(maxsize=128)
+def _find_scoop_app(app_name: str) -> Path | None:
+    """Find the ``current`` directory of a Scoop app.
+    
+    Cached because installations do not change during a run.
+    """
+    for apps_dir in _APPS_DIRS:
+        app_path = apps_dir / app_name / "current"
+        if app_path.is_dir():
+            return app_path
+    return None
+
 
 class ScoopPlugin(MxxPlugin):
     """Plugin to resolve MAA paths starting with 'scoop' to actual Scoop installation paths.
@@ -13,7 +52,7 @@ class ScoopPlugin(MxxPlugin):
         - directory = "scoop:maa-beta" → resolves to maa-beta's installation
     """
     
-    def pre_profile_start(self, profile: MxxProfile, ctx: Dict[str, Any]) -> None:
+    def pre_profile_start(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> None:
         """Resolve scoop paths before profile starts."""
         if profile.maa and profile.maa.path:
             path = profile.maa.path
@@ -39,31 +78,6 @@ class ScoopPlugin(MxxPlugin):
 
     def _resolve_scoop_path(self, app_name: str) -> Path | None:
         """Find the installation path for a Scoop app."""
-        # 1. Try SCOOP environment variable
-        scoop_root = os.environ.get("SCOOP")
-        if scoop_root:
-            app_path = Path(scoop_root) / "apps" / app_name / "current"
-            if app_path.exists():
-                return app_path
-        
-        # 2. Try default user scoop directory (~/scoop)
-        user_scoop = Path.home() / "scoop" / "apps" / app_name / "current"
-        if user_scoop.exists():
-            return user_scoop
-            
-        # 3. Try global scoop directory (ProgramData/scoop)
-        program_data = os.environ.get("ProgramData", "C:\\ProgramData")
-        global_scoop = Path(program_data) / "scoop" / "apps" / app_name / "current"
-        if global_scoop.exists():
-            return global_scoop
-            
-        # 4. Try SCOOP_GLOBAL environment variable
-        scoop_global = os.environ.get("SCOOP_GLOBAL")
-        if scoop_global:
-            global_path = Path(scoop_global) / "apps" / app_name / "current"
-            if global_path.exists():
-                return global_path
-
-        return None
+        return _find_scoop_app(app_name)
 
 plugin = ScoopPlugin()
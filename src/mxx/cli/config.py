@@ -1,6 +1,8 @@
 """Config management commands."""
 
+import heapq
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
@@ -8,9 +10,13 @@ import click
 
 from mxx.cli.plugin_aware import PluginAwareGroup
 from mxx.core.config import get_profile_path
+from mxx.core.model_load import invalidate_files
 from mxx.core.profile_resolver import (
     profile_resolver,
     get_model_type,
+    TYPE_LD,
+    TYPE_MAA,
+    TYPE_PROFILE,
     get_type_from_name,
     is_profile_part
 )
@@ -18,6 +24,15 @@ from mxx.core.parser import validate_profile
 from mxx.utils.nofuss.resolveEditor import resolve_editor
 
 
+# File listings longer than this are truncated to the first _LISTING_LIMIT
+# names unless --all is given
+_LARGE_LISTING = 500
+_LISTING_LIMIT = 100
+
+# Display badge by model type; full profiles have none
+_BADGE_MAP = {TYPE_LD: "[LD]", TYPE_MAA: "[MAA]"}
+
+
 def get_model_badge(name: str, model: Any = None) -> str:
     """Get display badge for a model.
     
@@ -28,17 +43,10 @@ def get_model_badge(name: str, model: Any = None) -> str:
     Returns:
         Badge string like "[LD]" or "[MAA]" or ""
     """
-    model_type = get_type_from_name(name)
-    if model_type == "LD":
-        return "[LD]"
-    elif model_type == "MAA":
-        return "[MAA]"
-    elif model:
-        detected_type = get_model_type(model)
-        if detected_type == "LD":
-            return "[LD]"
-        elif detected_type == "MAA":
-            return "[MAA]"
+    if badge := _BADGE_MAP.get(get_type_from_name(name)):
+        return badge
+    if model and (badge := _BADGE_MAP.get(get_model_type(model))):
+        return badge
     return ""
 
 
@@ -75,16 +83,16 @@ def format_model_line(name: str, model: Any, error: Optional[Exception]) -> str:
         Formatted display string
     """
     badge = get_model_badge(name, model)
-    badge_str = f" {badge}" if badge else ""
+    tail = f" {badge}" if badge else ""
     
     if error:
-        return f"  ✗ {name}{badge_str} - {error}"
+        return "".join(("  ✗ ", name, tail, " - ", str(error)))
     
     status, validation_error = validate_model(model, name)
     if validation_error:
-        return f"  {status} {name}{badge_str} - {validation_error}"
+        return "".join(("  ", status, " ", name, tail, " - ", str(validation_error)))
     
-    return f"  {status} {name}{badge_str}"
+    return "".join(("  ", status, " ", name, tail))
 
 
 def display_model_details(model: Any, name: str, is_plugin: bool) -> None:
@@ -98,15 +106,15 @@ def display_model_details(model: Any, name: str, is_plugin: bool) -> None:
     model_type = get_model_type(model)
     
     if is_plugin:
-        if model_type == "PROFILE":
+        if model_type == TYPE_PROFILE:
             click.echo(f"Profile: {model.name}")
             if model.ld:
                 click.echo(f"  LD: index={model.ld.index}")
             if model.maa:
                 click.echo(f"  MAA: {model.maa.directory or 'default'}")
-        elif model_type == "LD":
+        elif model_type == TYPE_LD:
             click.echo(f"LD: index={model.index}, name={model.name}")
-        elif model_type == "MAA":
+        elif model_type == TYPE_MAA:
             click.echo(f"MAA: directory={model.directory}")
     else:
         profiles_dir = get_profile_path()
@@ -155,6 +163,7 @@ def new(name: str, template: str):
     # Copy template to config location
     template_content = template_path.read_text()
     config_path.write_text(template_content)
+    invalidate_files()
     
     click.echo(f"Created config: {config_path}")
     
@@ -165,16 +174,18 @@ def new(name: str, template: str):
         click.echo(f"Warning: Failed to open editor: {e}", err=True)
 @config.command()
 @click.argument("name", required=False)
-def cat(name: str = None):
+@click.option("--all", "show_all", is_flag=True, help="List every config, even in large directories")
+def cat(name: str = None, show_all: bool = False):
     """Display config contents.
     
     Args:
         name: Name of config to display (without .toml). If omitted, lists all configs.
+        show_all: Don't truncate large config listings
     """
     if name:
         _display_single_config(name)
     else:
-        _list_all_configs()
+        _list_all_configs(show_all)
 
 
 def _display_single_config(name: str) -> None:
@@ -207,32 +218,47 @@ def _display_single_config(name: str) -> None:
         sys.exit(1)
 
 
-def _list_all_configs() -> None:
-    """List all available configs."""
+def _list_all_configs(show_all: bool = False) -> None:
+    """List all available configs.
+    
+    Args:
+        show_all: List every file config instead of only the first
+            _LISTING_LIMIT names when there are more than _LARGE_LISTING
+    """
     all_items = profile_resolver.list_all_profiles()
     
     if not all_items:
         click.echo("No configs found.")
         return
     
-    # Separate by source
-    plugin_items = {n: item for n, item in all_items.items() if item[1]}
-    file_items = {n: item for n, item in all_items.items() if not item[1]}
+    # Separate by source in one pass into flat (name, model, error) rows,
+    # then sort each side once by name
+    plugin_items = []
+    file_items = []
+    for name, (model, is_plugin, error) in all_items.items():
+        (plugin_items if is_plugin else file_items).append((name, model, error))
+    plugin_items.sort(key=itemgetter(0))
+    hidden = 0
+    if not show_all and len(file_items) > _LARGE_LISTING:
+        # Only the first names are shown, so avoid sorting the whole list
+        hidden = len(file_items) - _LISTING_LIMIT
+        file_items = heapq.nsmallest(_LISTING_LIMIT, file_items, key=itemgetter(0))
+    else:
+        file_items.sort(key=itemgetter(0))
     
-    # Display plugins
+    # Build the whole listing and write it in one go
+    lines = []
     if plugin_items:
-        click.echo("Plugin profiles:")
-        for name in sorted(plugin_items.keys()):
-            model, _, error = plugin_items[name]
-            click.echo(format_model_line(name, model, error))
+        lines.append("Plugin profiles:")
+        lines.extend(format_model_line(name, model, error) for name, model, error in plugin_items)
     
-    # Display files
     if file_items:
         if plugin_items:
-            click.echo("\nFile configs:")
+            lines.append("\nFile configs:")
         else:
-            click.echo("Available configs:")
-        
-        for name in sorted(file_items.keys()):
-            model, _, error = file_items[name]
-            click.echo(format_model_line(name, model, error))
+            lines.append("Available configs:")
+        lines.extend(format_model_line(name, model, error) for name, model, error in file_items)
+        if hidden:
+            lines.append(f"  ... {hidden} more (use --all to list everything)")
+    
+    click.echo("\n".join(lines))
@@ -29,9 +29,10 @@ def main():
     # Set vars in plugin loader context immediately
     profile_resolver.plugin_loader.set_context({'vars': vars_dict})
     
-    # Initialize plugins with vars available
-    profile_resolver.plugin_loader.init()
-    profile_resolver.plugin_loader.register_commands(cli)
+    # Plugin commands are registered when Click looks up or lists commands;
+    # once the discovery cache knows which plugin provides a command, only
+    # that plugin is imported, and plugin init is deferred until a command
+    # actually runs (see PluginAwareGroup and PluginAwareCommand.invoke)
     
     # Run Click with cleaned arguments
     try:
@@ -1,32 +1,65 @@
 """Custom Click command and group classes with plugin hook support."""
 
 import click
-from typing import Any
+from typing import Any, List, Optional
+
+from mxx.plugin_system import get_plugin_loader
+
+
+def _parse_var_values(var_values) -> dict:
+    """Parse key=value strings into a dictionary, ignoring entries without '='.
+    
+    Args:
+        var_values: Iterable of raw --var values
+        
+    Returns:
+        Dictionary of parsed variables
+    """
+    vars_dict = {}
+    for var in var_values:
+        # partition returns a fixed 3-tuple instead of allocating a list
+        key, sep, value = var.partition('=')
+        if sep:
+            vars_dict[key.strip()] = value.strip()
+    return vars_dict
 
 
 def parse_var_from_args(ctx: click.Context) -> dict:
     """Extract --var arguments from context and parse them.
     
+    The result is stored on ``ctx.obj`` so repeated calls for the same
+    invocation return it without parsing again.
+    
     Args:
         ctx: Click context
         
     Returns:
         Dictionary of parsed variables
     """
-    vars_dict = {}
+    if isinstance(ctx.obj, dict) and '_parsed_vars' in ctx.obj:
+        return ctx.obj['_parsed_vars']
     
-    # Check if --var is in the arguments
-    if hasattr(ctx, 'params') and 'var' in ctx.params:
-        var_values = ctx.params.pop('var', [])
-        if var_values:
-            for var in var_values:
-                if '=' in var:
-                    key, value = var.split('=', 1)
-                    vars_dict[key.strip()] = value.strip()
+    vars_dict = _parse_var_values(ctx.params.pop('var', None) or ())
     
+    if isinstance(ctx.obj, dict):
+        ctx.obj['_parsed_vars'] = vars_dict
     return vars_dict
 
 
+def _register_plugin_commands(ctx: click.Context, cmd_name: Optional[str] = None) -> bool:
+    """Register plugin commands on the root group if not done yet.
+    
+    Args:
+        ctx: Click context of any group in the command tree
+        cmd_name: Root command being looked up; only plugins known to
+            provide it register (None registers every plugin)
+        
+    Returns:
+        True if commands were registered by this call
+    """
+    return get_plugin_loader().ensure_commands(ctx.find_root().command, cmd_name)
+
+
 class PluginAwareCommand(click.Command):
     """Command class that invokes plugin hooks before and after execution."""
     
@@ -41,31 +74,70 @@ class PluginAwareCommand(click.Command):
         """
         # Get plugin loader from context
         plugin_loader = ctx.obj.get('plugin_loader') if ctx.obj else None
+        name = self.name
         
-        # Pre-command hook
+        # Plugins are initialized lazily, with the context of the first
+        # command; each hook below is only called if some plugin implements it
         if plugin_loader:
-            plugin_loader.pre_command(command_name=self.name, ctx=ctx)
+            plugin_loader.ensure_init(ctx)
+            if plugin_loader.has_hook("pre_command"):
+                plugin_loader.pre_command(command_name=name, ctx=ctx)
         
         try:
             # Execute the actual command
             result = super().invoke(ctx)
             
             # Post-command hook (success)
-            if plugin_loader:
-                plugin_loader.post_command(command_name=self.name, ctx=ctx, result=result)
+            if plugin_loader and plugin_loader.has_hook("post_command"):
+                plugin_loader.post_command(command_name=name, ctx=ctx, result=result)
             
             return result
             
         except Exception as e:
             # Command error hook
-            if plugin_loader:
-                plugin_loader.command_error(command_name=self.name, ctx=ctx, error=e)
+            if plugin_loader and plugin_loader.has_hook("command_error"):
+                plugin_loader.command_error(command_name=name, ctx=ctx, error=e)
             raise
 
 
 class PluginAwareGroup(click.Group):
     """Group class that ensures all commands and subgroups use plugin-aware classes."""
     
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Look up a command, registering the plugin commands it may need.
+        
+        At the root, plugins known to provide cmd_name register first, so a
+        plugin command still replaces a built-in of the same name. In
+        subgroups, plugin commands are registered on the first miss.
+        
+        Args:
+            ctx: Click context
+            cmd_name: Name of the subcommand
+            
+        Returns:
+            The command, or None if neither the group nor a plugin provides it
+        """
+        if ctx.parent is None:
+            _register_plugin_commands(ctx, cmd_name)
+            return super().get_command(ctx, cmd_name)
+        
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and _register_plugin_commands(ctx):
+            cmd = super().get_command(ctx, cmd_name)
+        return cmd
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List commands, including those registered by plugins.
+        
+        Args:
+            ctx: Click context
+            
+        Returns:
+            Sorted command names
+        """
+        _register_plugin_commands(ctx)
+        return super().list_commands(ctx)
+    
     def command(self, *args, **kwargs):
         """Register a command with plugin awareness.
         
@@ -1,12 +1,16 @@
 """Profile execution commands."""
 
+import shutil
+import subprocess
 import sys
 
 import click
 
 from mxx.cli.plugin_aware import PluginAwareGroup
+from mxx.core.parser import get_maa_app_path, validate_profile
 from mxx.core.profile_resolver import profile_resolver
 from mxx.core.runner import ProfileRunner
+from mxx.utils.nofuss.sleep import sleep_with_countdown
 
 
 @click.group(cls=PluginAwareGroup)
@@ -31,61 +35,16 @@ def up(profiles: tuple[str, ...], waittime: int | None, kill: bool, kill_all: bo
         kill: Kill the specific profile after lifetime
         kill_all: Kill all processes after lifetime
     """
-    from mxx.core.parser import validate_profile
-    from mxx.utils.nofuss.sleep import sleep_with_countdown
-    
-    runner = ProfileRunner(profile_resolver.plugin_loader)
+    plugin_loader = profile_resolver.plugin_loader
+    runner = ProfileRunner(plugin_loader)
     
     for profile_name in profiles:
         try:
             profile, is_plugin = profile_resolver.get_profile(profile_name)
             
-            # Update plugin loader context with current profile name
-            current_context = profile_resolver.plugin_loader.context.copy()
-            current_context['profile_name'] = profile_name
-            profile_resolver.plugin_loader.set_context(current_context)
-            
-            source = "[PLUGIN]" if is_plugin else ""
-            
-            # Validate before starting
-            validate_profile(profile)
-            
-            click.echo(f"Starting profile: {profile_name} {source}")
-            
-            # Use CLI override or profile's waittime or default
-            ld_wait = waittime if waittime is not None else (profile.waittime or 15)
-            runner.start_profile(profile, wait_time=ld_wait, validate=False)
-            
-            click.echo(f"✓ Profile '{profile_name}' started successfully")
-            
-            # Handle lifetime and killing
-            if kill or kill_all:
-                if profile.lifetime:
-                    success = sleep_with_countdown(profile.lifetime, profile, f"Profile '{profile_name}' running")
-                    
-                    # Update context to mark failure if processes terminated early
-                    if not success:
-                        current_context = profile_resolver.plugin_loader.context.copy()
-                        current_context['profile_failed'] = True
-                        current_context['profile_name'] = profile_name
-                        profile_resolver.plugin_loader.set_context(current_context)
-                        
-                        # Notify plugins of the failure (calls post_profile_start with failed=True context)
-                        runner.notify_profile_failure(profile)
-                        
-                        click.echo(f"✗ Profile '{profile_name}' failed during execution", err=True)
-                        sys.exit(1)
-                    
-                    if kill_all:
-                        click.echo("Lifetime expired, stopping all processes...")
-                        ctx = click.get_current_context()
-                        ctx.invoke(down)
-                    elif kill:
-                        click.echo(f"Lifetime expired, stopping profile '{profile_name}'...")
-                        runner.kill_profile(profile)
-                        click.echo(f"✓ Profile '{profile_name}' stopped")
-                else:
-                    click.echo("Warning: --kill or --kill-all specified but profile has no lifetime")
+            # Expose the current profile name to plugins while it runs
+            with plugin_loader.scoped_context(profile_name=profile_name):
+                _start_profile(runner, profile, profile_name, is_plugin, waittime, kill, kill_all)
             
         except FileNotFoundError as e:
             click.echo(f"Error: {e}", err=True)
@@ -95,6 +54,58 @@ def up(profiles: tuple[str, ...], waittime: int | None, kill: bool, kill_all: bo
             sys.exit(1)
 
 
+def _start_profile(runner: ProfileRunner, profile, profile_name: str, is_plugin: bool,
+                   waittime: int | None, kill: bool, kill_all: bool) -> None:
+    """Start a single profile and handle its lifetime.
+    
+    Args:
+        runner: Profile runner
+        profile: Resolved profile
+        profile_name: Name the profile was requested by
+        is_plugin: Whether the profile comes from a plugin
+        waittime: Optional wait time override between LD and MAA start
+        kill: Kill the specific profile after lifetime
+        kill_all: Kill all processes after lifetime
+    """
+    source = "[PLUGIN]" if is_plugin else ""
+    
+    # Validate before starting
+    validate_profile(profile)
+    
+    click.echo(f"Starting profile: {profile_name} {source}")
+    
+    # Use CLI override or profile's waittime or default
+    ld_wait = waittime if waittime is not None else (profile.waittime or 15)
+    runner.start_profile(profile, wait_time=ld_wait, validate=False)
+    
+    click.echo(f"✓ Profile '{profile_name}' started successfully")
+    
+    # Handle lifetime and killing
+    if kill or kill_all:
+        if profile.lifetime:
+            success = sleep_with_countdown(profile.lifetime, profile, f"Profile '{profile_name}' running")
+            
+            # Mark failure in the context if processes terminated early
+            if not success:
+                with profile_resolver.plugin_loader.scoped_context(profile_failed=True):
+                    # Notify plugins of the failure (calls post_profile_start with failed=True context)
+                    runner.notify_profile_failure(profile)
+                
+                click.echo(f"✗ Profile '{profile_name}' failed during execution", err=True)
+                sys.exit(1)
+            
+            if kill_all:
+                click.echo("Lifetime expired, stopping all processes...")
+                ctx = click.get_current_context()
+                ctx.invoke(down)
+            elif kill:
+                click.echo(f"Lifetime expired, stopping profile '{profile_name}'...")
+                runner.kill_profile(profile)
+                click.echo(f"✓ Profile '{profile_name}' stopped")
+        else:
+            click.echo("Warning: --kill or --kill-all specified but profile has no lifetime")
+
+
 @run.command()
 @click.argument("profiles", nargs=-1)
 def down(profiles: tuple[str, ...]):
@@ -103,9 +114,8 @@ def down(profiles: tuple[str, ...]):
     If profile names are provided, kills only those profiles.
     If no profiles specified, kills all MAA and LD processes.
     """
-    import os
-    from mxx.utils.kill import kill_processes_by_path
-    from mxx.core.parser import get_maa_app_path
+    # psutil (pulled in by kill) is only loaded when something is stopped
+    from mxx.utils.kill import kill_processes_by_paths
     
     runner = ProfileRunner(profile_resolver.plugin_loader)
     
@@ -124,20 +134,24 @@ def down(profiles: tuple[str, ...]):
         click.echo("Stopping all profiles...")
         
         try:
-            total_killed = 0
+            # Start the LD quitall first so it runs while MAA processes are found
+            ldpx = shutil.which("ldpx")
+            ldpx_proc = subprocess.Popen([ldpx, "console", "quitall"]) if ldpx else None
+            if ldpx_proc is None:
+                click.echo("Warning: ldpx not found, LD instances were not stopped", err=True)
             
-            # Kill all MAA processes by scanning for MAA executables
-            for name, model in profile_resolver.list_all_profiles():
-                if hasattr(model, 'maa') and model.maa:
+            # Kill all MAA processes of every profile in a single process scan
+            app_paths = set()
+            for name, (model, _, _) in profile_resolver.list_all_profiles().items():
+                if getattr(model, 'maa', None):
                     try:
-                        app_path = get_maa_app_path(model.maa)
-                        killed = kill_processes_by_path(app_path)
-                        total_killed += killed
+                        app_paths.add(get_maa_app_path(model.maa))
                     except Exception:
                         pass
+            total_killed = kill_processes_by_paths(app_paths)
             
-            # Kill all LD processes using ldpx
-            os.system("ldpx console quitall")
+            if ldpx_proc is not None:
+                ldpx_proc.wait()
             
             if total_killed > 0:
                 click.echo(f"✓ Stopped {total_killed} MAA process(es) and all LD instances")
@@ -27,8 +27,15 @@ def get_config_path() -> Path:
     return config_dir
 
 
+# Profile directories already created by this process
+_ready_profile_dirs = set()
+
+
 def get_profile_path() -> Path:
     """Get the path to the profiles directory."""
     profile_dir = get_config_path() / "configs"
-    profile_dir.mkdir(parents=True, exist_ok=True)
+    # Only touch the filesystem the first time each directory is requested
+    if profile_dir not in _ready_profile_dirs:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        _ready_profile_dirs.add(profile_dir)
     return profile_dir
\ No newline at end of file
@@ -1,4 +1,8 @@
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from mxx.core.config import get_profile_path
 from mxx.models.ld import LDModel
 from mxx.models.maa import MaaModel
@@ -6,68 +10,195 @@ from mxx.models.profile import MxxProfile
 from mxx.utils.nofuss.toml import load_toml
 
 
+# Last directory listing as (profile_dir, mtime_ns, files, files_by_stem);
+# reused while the directory is unchanged
+_listing = None
+
+def _scan_files():
+    global _listing
+    profile_dir = get_profile_path()
+    mtime = profile_dir.stat().st_mtime_ns
+    if _listing is None or _listing[0] != profile_dir or _listing[1] != mtime:
+        files = []
+        for file in profile_dir.glob("*.toml"):
+            # Path(file), name with no extension and the part after the last dot
+            stem = file.stem
+            _, sep, part = stem.rpartition(".")
+            files.append((file, stem, part if sep else None))
+        _listing = (profile_dir, mtime, files, {entry[1]: entry for entry in files})
+    return _listing
+
+def invalidate_files():
+    """
+    forget the cached directory listing and models, e.g. after writing a new
+    config (a name may now resolve to a different file)
+    """
+    global _listing
+    with _lock:
+        _listing = None
+        _cache.clear()
+
+def forget_model(name : str):
+    """
+    drop the cached model for name so the next load_model re-reads its file;
+    models built from it as a template keep their copy until invalidate_files
+    """
+    with _lock:
+        _cache.pop(name, None)
+        _raw_cache.pop(name, None)
+
 def get_all_files():
-    for file in get_profile_path().glob("*.toml"):
-        # Path(file) and name with no extension
-        part = str(file.stem).split(".")[-1]   
-        yield file, file.stem, None if part == file.stem else part
+    return list(_scan_files()[2])
+
+def get_all_files_with_stat():
+    """
+    list toml files with a fresh os.scandir pass as (Path, stem, part3,
+    mtime_ns); on windows the stat comes with the directory entry, so this
+    costs one directory read instead of a stat per file
+    """
+    profile_dir = get_profile_path()
+    with os.scandir(profile_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".toml") or not entry.is_file():
+                continue
+            stem = entry.name[:-5]
+            _, sep, part = stem.rpartition(".")
+            yield profile_dir / entry.name, stem, part if sep else None, entry.stat().st_mtime_ns
 
 def get_file(name : str):
-    for file, part2, part3 in get_all_files():
-        if file.stem == name:
-            return file, part2, part3
+    _, _, files, files_by_stem = _scan_files()
+    entry = files_by_stem.get(name)
+    if entry is not None:
+        return entry
         
     if "." in name:
         return None
     
-    for file, part2, part3 in get_all_files():
-        if file.stem.split(".")[0] == name:
+    for file, part2, part3 in files:
+        if part2.partition(".")[0] == name:
             return file, part2, part3
     return None
 
 _cache = {}
+_lock = threading.RLock()
 
-def load_model(name : str):
+# Parsed TOML (or the error raised while parsing) by file stem, filled by
+# preload_files and consumed once by load_model
+_raw_cache = {}
+
+def _parse_file(file):
+    try:
+        return load_toml(file)
+    except Exception as e:
+        return e
+
+def preload_files(files):
     """
-    part is defined as any file that goes like xxx.ld.toml xxx.maa.toml
-    """ 
-    if name in _cache:
-        return _cache[name]
+    read and parse the given toml files concurrently so their disk reads overlap
+    """
+    files = [file for file in files if file.stem not in _cache and file.stem not in _raw_cache]
+    if len(files) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as ex:
+        for file, data in zip(files, ex.map(_parse_file, files)):
+            _raw_cache[file.stem] = data
 
+def _read_model_data(name : str):
+    """
+    find and parse the file for name, returning (tomldata, part3, templates)
+    where templates lists (key, template_name) references, or None if not found
+    """
     file_info = get_file(name)
     if file_info is None:
         return None
     file, part2, part3 = file_info
     
-    tomldata = load_toml(file)
+    tomldata = _raw_cache.pop(file.stem, None)
+    if tomldata is None:
+        tomldata = load_toml(file)
+    elif isinstance(tomldata, Exception):
+        raise tomldata
+    
+    templates = []
     for k, v in tomldata.items():
         if isinstance(v, dict) and "template" in v:
             if len(v) != 1:
                 raise ValueError(f"Template definition for '{k}' in '{name}' has extra keys.")
+            templates.append((k, v["template"]))
+    return tomldata, part3, templates
 
-            template_name = v["template"]
-            template_model = load_model(f"{template_name}.{k}")
-            if template_model is None:
-                raise ValueError(f"Template model '{template_name}' not found for '{k}' in '{name}'")
-            tomldata[k] = template_model
-
+def _build_model(tomldata : dict, part3):
     match part3:
         case "maa":
-            data = MaaModel.create(tomldata)
+            return MaaModel.create(tomldata)
         case "ld":
-            data = LDModel.create(tomldata)
+            return LDModel.create(tomldata)
         case _:
-            data = MxxProfile.create(tomldata)  
+            return MxxProfile.create(tomldata)
+
+def load_model(name : str):
+    """
+    part is defined as any file that goes like xxx.ld.toml xxx.maa.toml
+
+    templates are resolved with an explicit stack so every model is parsed
+    and built exactly once, dependencies first
+    """ 
+    model = _cache.get(name)
+    if model is not None:
+        return model
+
+    # building is serialized so concurrent callers never race on the caches
+    with _lock:
+        if name in _cache:
+            return _cache[name]
+        return _build_with_templates(name)
+
+def _build_with_templates(name : str):
+    loaded = _read_model_data(name)
+    if loaded is None:
+        return None
+
+    # models read but not yet built; these are exactly the names on the stack
+    pending = {name: loaded}
+    stack = [name]
+    while stack:
+        current = stack[-1]
+        tomldata, part3, templates = pending[current]
+
+        # descend into the first template that is not built yet
+        unresolved = None
+        for k, template_name in templates:
+            dep = f"{template_name}.{k}"
+            if dep in _cache:
+                continue
+            if dep in pending:
+                raise ValueError(f"Circular template reference '{template_name}' for '{k}' in '{current}'")
+            dep_loaded = _read_model_data(dep)
+            if dep_loaded is None:
+                raise ValueError(f"Template model '{template_name}' not found for '{k}' in '{current}'")
+            unresolved = dep
+            pending[dep] = dep_loaded
+            break
+        if unresolved is not None:
+            stack.append(unresolved)
+            continue
+
+        for k, template_name in templates:
+            tomldata[k] = _cache[f"{template_name}.{k}"]
+        _cache[current] = _build_model(tomldata, part3)
+        del pending[current]
+        stack.pop()
 
-    _cache[name] = data
-    return data
+    return _cache[name]
 
 def get_list():
     for file, part2, part3 in get_all_files():
         yield part2
 
 def get_models():
-    for name in get_list():
+    files = list(get_all_files())
+    preload_files([file for file, part2, part3 in files])
+    for file, name, part3 in files:
         model = load_model(name)
         if model is not None:
             yield name, model
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Parser module for validating profiles before execution."""
 
+import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from mxx.models.profile import MxxProfile
 from mxx.models.ld import LDModel
 from mxx.models.maa import MaaModel
@@ -12,6 +14,32 @@ class ValidationError(Exception):
     pass
 
 
+# Seconds an existence check stays valid; listings validate every profile,
+# often sharing the same MAA directories
+_EXISTS_TTL = 2.0
+
+# Path string -> (checked_at, exists)
+_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def _cached_exists(path: str) -> bool:
+    """Check whether a path exists, reusing results younger than _EXISTS_TTL.
+    
+    Args:
+        path: Filesystem path as a string
+        
+    Returns:
+        True if the path exists
+    """
+    now = time.monotonic()
+    entry = _exists_cache.get(path)
+    if entry is not None and now - entry[0] < _EXISTS_TTL:
+        return entry[1]
+    exists = os.path.exists(path)
+    _exists_cache[path] = (now, exists)
+    return exists
+
+
 def validate_ld_model(ld: LDModel) -> None:
     """Validate LD model configuration.
     
@@ -44,15 +72,14 @@ def validate_maa_model(maa: MaaModel, skip_path_check: bool = False) -> None:
         raise ValidationError("MAA path cannot be empty")
     
     # Skip path validation for plugin-managed paths (like "scoop:app")
-    if skip_path_check or (isinstance(maa.path, str) and maa.path.startswith("scoop")):
+    if skip_path_check or maa.is_plugin_managed:
         # Only check that required fields are present
         if not maa.app:
             raise ValidationError("MAA app executable must be specified")
         return
     
     # Check if path exists
-    path = Path(maa.path)
-    if not path.exists():
+    if not _cached_exists(str(maa.path)):
         raise ValidationError(f"MAA path does not exist: {maa.path}")
     
     # Check if app is specified
@@ -60,14 +87,14 @@ def validate_maa_model(maa: MaaModel, skip_path_check: bool = False) -> None:
         raise ValidationError("MAA app executable must be specified")
     
     # Construct full app path
-    app_path = path / maa.app
-    if not app_path.exists():
+    app_path = get_maa_app_path(maa)
+    if not _cached_exists(str(app_path)):
         raise ValidationError(f"MAA app executable not found: {app_path}")
     
     # Validate config directory if specified
     if maa.configDir:
-        config_path = path / maa.configDir
-        if not config_path.exists():
+        config_path = get_maa_config_path(maa)
+        if not _cached_exists(str(config_path)):
             raise ValidationError(f"MAA config directory not found: {config_path}")
 
 
@@ -83,25 +110,30 @@ def validate_profile(profile: MxxProfile) -> None:
     if not profile:
         raise ValidationError("Profile is None")
     
+    ld = profile.ld
+    maa = profile.maa
+    lifetime = profile.lifetime
+    waittime = profile.waittime
+    
     # At least one of ld or maa must be present
-    if not profile.ld and not profile.maa:
+    if not ld and not maa:
         raise ValidationError("Profile must have at least LD or MAA configuration")
     
     # Validate lifetime if present
-    if profile.lifetime is not None and profile.lifetime <= 0:
+    if lifetime is not None and lifetime <= 0:
         raise ValidationError("Profile lifetime must be positive")
     
     # Validate waittime if present
-    if profile.waittime is not None and profile.waittime < 0:
+    if waittime is not None and waittime < 0:
         raise ValidationError("Profile waittime cannot be negative")
     
     # Validate LD if present
-    if profile.ld:
-        validate_ld_model(profile.ld)
+    if ld:
+        validate_ld_model(ld)
     
     # Validate MAA if present
-    if profile.maa:
-        validate_maa_model(profile.maa)
+    if maa:
+        validate_maa_model(maa)
 
 
 def get_maa_app_path(maa: MaaModel) -> Path:
@@ -113,7 +145,11 @@ def get_maa_app_path(maa: MaaModel) -> Path:
     Returns:
         Full path to the MAA executable
     """
-    return Path(maa.path) / maa.app
+    key = (maa.path, maa.app)
+    cached = maa._app_path
+    if cached is None or cached[0] != key:
+        cached = maa._app_path = (key, Path(maa.path) / maa.app)
+    return cached[1]
 
 
 def get_maa_config_path(maa: MaaModel) -> Optional[Path]:
@@ -127,4 +163,8 @@ def get_maa_config_path(maa: MaaModel) -> Optional[Path]:
     """
     if not maa.configDir:
         return None
-    return Path(maa.path) / maa.configDir
+    key = (maa.path, maa.configDir)
+    cached = maa._config_path
+    if cached is None or cached[0] != key:
+        cached = maa._config_path = (key, Path(maa.path) / maa.configDir)
+    return cached[1]
@@ -1,14 +1,25 @@
 """Profile resolution utilities."""
 
+import sys
 from typing import Optional, Any
 
-from mxx.core.model_load import load_model, get_all_files
-from mxx.plugin_system import PluginLoader
+from mxx.core.model_load import load_model, get_all_files_with_stat, preload_files, forget_model
+from mxx.plugin_system import get_plugin_loader
 from mxx.models.profile import MxxProfile
 from mxx.models.ld import LDModel
 from mxx.models.maa import MaaModel
 
 
+# Model type names shared by every classifier and caller
+TYPE_LD = sys.intern("LD")
+TYPE_MAA = sys.intern("MAA")
+TYPE_PROFILE = sys.intern("PROFILE")
+
+# File stem suffixes of model parts
+_LD_SUFFIX = sys.intern(".ld")
+_MAA_SUFFIX = sys.intern(".maa")
+
+
 def get_model_type(model: Any) -> str:
     """Determine model type from instance.
     
@@ -19,11 +30,28 @@ def get_model_type(model: Any) -> str:
         Model type: "LD", "MAA", or "PROFILE"
     """
     if isinstance(model, LDModel):
-        return "LD"
+        return TYPE_LD
     elif isinstance(model, MaaModel):
-        return "MAA"
+        return TYPE_MAA
     else:
-        return "PROFILE"
+        return TYPE_PROFILE
+
+
+def classify_name(name: str) -> tuple[str, bool]:
+    """Determine model type and whether the name is a model part.
+    
+    Args:
+        name: File stem (e.g., "profile.ld", "profile.maa", "profile")
+        
+    Returns:
+        Tuple of (model type, is_part): ("LD", True), ("MAA", True) or
+        ("PROFILE", False)
+    """
+    if name.endswith(_LD_SUFFIX):
+        return TYPE_LD, True
+    if name.endswith(_MAA_SUFFIX):
+        return TYPE_MAA, True
+    return TYPE_PROFILE, False
 
 
 def get_type_from_name(name: str) -> str:
@@ -35,12 +63,7 @@ def get_type_from_name(name: str) -> str:
     Returns:
         Model type: "LD", "MAA", or "PROFILE"
     """
-    if ".ld" in name:
-        return "LD"
-    elif ".maa" in name:
-        return "MAA"
-    else:
-        return "PROFILE"
+    return classify_name(name)[0]
 
 
 def is_profile_part(name: str) -> bool:
@@ -52,22 +75,24 @@ def is_profile_part(name: str) -> bool:
     Returns:
         True if it's a part (.ld or .maa), False otherwise
     """
-    return '.' in name
+    return classify_name(name)[1]
 
 
 class ProfileResolver:
     """Resolves profiles from files or plugins."""
     
     def __init__(self):
-        """Initialize resolver with plugin loader."""
-        self._plugin_loader = PluginLoader()
+        """Initialize resolver; the plugin loader is created on first use."""
+        self._plugin_loader = None
         self._plugin_profiles = None
+        # File stem -> (mtime_ns, model, error) from the last get_file_items
+        self._model_cache: dict[str, tuple[int, Optional[Any], Optional[Exception]]] = {}
     
     @property
     def plugin_profiles(self):
         """Lazy load plugin profiles."""
         if self._plugin_profiles is None:
-            self._plugin_profiles = self._plugin_loader.load_plugin_profiles()
+            self._plugin_profiles = self.plugin_loader.load_plugin_profiles()
         return self._plugin_profiles
     
     def get_profile(self, name: str) -> tuple[MxxProfile, bool]:
@@ -87,9 +112,10 @@ class ProfileResolver:
         Raises:
             FileNotFoundError: If profile not found
         """
-        # Check plugin profiles first (only for full profiles, not parts)
-        if '.' not in name and name in self.plugin_profiles:
-            return self.plugin_profiles[name], True
+        # Check plugin profiles first (only for full profiles, not parts);
+        # only the plugin owning the name builds its profiles
+        if '.' not in name and self.plugin_loader.has_profile(name):
+            return self.plugin_loader.get_profile(name), True
         
         # Check file-based profiles/models
         profile = load_model(name)
@@ -116,14 +142,41 @@ class ProfileResolver:
             Dictionary mapping name to (model, is_plugin=False, error)
         """
         results = {}
-        for file, stem, part in get_all_files():
+        stale = []
+        # One scandir pass yields each file with its mtime
+        for file, stem, part, mtime in get_all_files_with_stat():
+            cached = self._model_cache.get(stem)
+            if cached is not None and cached[0] == mtime:
+                results[stem] = (cached[1], False, cached[2])
+            else:
+                if cached is not None:
+                    forget_model(stem)
+                stale.append((file, stem, mtime))
+                results[stem] = None  # keeps the listing in file order
+        
+        preload_files([file for file, stem, mtime in stale])
+        for file, stem, mtime in stale:
             try:
-                model = load_model(stem)
-                results[stem] = (model, False, None)
+                model, error = load_model(stem), None
             except Exception as e:
-                results[stem] = (None, False, e)
+                model, error = None, e
+            self._model_cache[stem] = (mtime, model, error)
+            results[stem] = (model, False, error)
         return results
     
+    def invalidate(self, stem: Optional[str] = None) -> None:
+        """Forget cached file items so the next listing reloads them.
+        
+        Args:
+            stem: File stem to forget, or None to forget every file item
+        """
+        if stem is None:
+            for name in self._model_cache:
+                forget_model(name)
+            self._model_cache.clear()
+        elif self._model_cache.pop(stem, None) is not None:
+            forget_model(stem)
+    
     def list_all_profiles(self) -> dict[str, tuple[Optional[MxxProfile], bool, Optional[Exception]]]:
         """List all profiles and model parts with their status.
         
@@ -157,9 +210,19 @@ class ProfileResolver:
     
     @property
     def plugin_loader(self):
-        """Get the plugin loader instance."""
+        """Get the plugin loader instance, discovering plugins on first access."""
+        if self._plugin_loader is None:
+            self._plugin_loader = get_plugin_loader()
         return self._plugin_loader
 
 
-# Global resolver instance
-profile_resolver = ProfileResolver()
+def __getattr__(name: str) -> Any:
+    """Create the global resolver instance on first access.
+    
+    The instance is stored in the module globals, so later lookups are plain
+    attribute reads.
+    """
+    if name == "profile_resolver":
+        instance = globals()["profile_resolver"] = ProfileResolver()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
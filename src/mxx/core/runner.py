@@ -1,11 +1,97 @@
 """Runner module for starting and stopping profiles."""
 
-import os
 import time
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from mxx.models.profile import MxxProfile
 from mxx.core.parser import validate_profile, get_maa_app_path
-from mxx.utils.kill import kill_processes_by_path
+
+
+def _run_ldpx(action: str, ld) -> None:
+    """Run an ldpx console action for an LD instance and wait for it.
+    
+    The command runs without a shell, so instance names with spaces or
+    shell metacharacters are passed through unchanged.
+    
+    A missing ldpx only prints a warning, so callers carry on (e.g. MAA
+    is still launched after the LD wait times out).
+    
+    Args:
+        action: ldpx console action (e.g. "launch" or "quit")
+        ld: LDModel instance
+    """
+    import shutil
+    import subprocess
+    
+    if ld.index is not None:
+        target = ["--index", str(ld.index)]
+    elif ld.name:
+        target = ["--name", ld.name]
+    else:
+        return
+    ldpx = shutil.which("ldpx")
+    if ldpx is None:
+        print(f"Warning: ldpx not found, could not {action} LD instance")
+        return
+    subprocess.run([ldpx, "console", action, *target])
+
+
+def _ld_is_ready(ld) -> bool:
+    """Check whether an LD instance has finished booting Android.
+    
+    Parses ``ldpx console list2``, whose rows are
+    ``index,title,top_hwnd,bind_hwnd,android_started,pid,vbox_pid``.
+    
+    Args:
+        ld: LDModel instance
+        
+    Returns:
+        True if the instance reports Android as started
+    """
+    import subprocess
+    
+    try:
+        result = subprocess.run(
+            ["ldpx", "console", "list2"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    
+    for line in result.stdout.splitlines():
+        fields = line.split(",")
+        if len(fields) < 5:
+            continue
+        if ld.index is not None:
+            matches = fields[0].strip() == str(ld.index)
+        else:
+            matches = fields[1].strip() == ld.name
+        if matches:
+            return fields[4].strip() == "1"
+    return False
+
+
+def _wait_for_ld_ready(ld, timeout: float, interval: float = 0.5) -> bool:
+    """Wait until an LD instance is booted, or until timeout elapses.
+    
+    Args:
+        ld: LDModel instance
+        timeout: Maximum seconds to wait
+        interval: Seconds between readiness checks
+        
+    Returns:
+        True if the instance became ready before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if _ld_is_ready(ld):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
 
 
 class ProfileRunner:
@@ -18,6 +104,8 @@ class ProfileRunner:
             plugin_loader: Optional plugin loader instance
         """
         self.runtime: Dict[str, Any] = {}
+        # Read-only view handed to plugins; reflects later set_runtime updates
+        self._runtime_view = MappingProxyType(self.runtime)
         self._plugin_loader: Optional[Any] = plugin_loader
     
     def set_plugin_loader(self, loader: Any) -> None:
@@ -56,8 +144,9 @@ class ProfileRunner:
         Returns:
             True if profile can run, False otherwise
         """
-        if self._plugin_loader:
-            return self._plugin_loader.can_run_profile(profile, self.runtime)
+        # Skip the loader call entirely when no plugin implements the check
+        if self._plugin_loader and self._plugin_loader.has_hook("can_run_profile"):
+            return self._plugin_loader.can_run_profile(profile, self._runtime_view)
         return True
     
     def _can_kill_profile(self, profile: MxxProfile) -> bool:
@@ -69,8 +158,9 @@ class ProfileRunner:
         Returns:
             True if profile can be killed, False otherwise
         """
-        if self._plugin_loader:
-            return self._plugin_loader.can_kill_profile(profile, self.runtime)
+        # Skip the loader call entirely when no plugin implements the check
+        if self._plugin_loader and self._plugin_loader.has_hook("can_kill_profile"):
+            return self._plugin_loader.can_kill_profile(profile, self._runtime_view)
         return True
     
     def start_profile(
@@ -83,7 +173,8 @@ class ProfileRunner:
         
         Args:
             profile: Profile to start
-            wait_time: Seconds to wait between LD launch and MAA launch
+            wait_time: Maximum seconds to wait for LD to boot before
+                launching MAA
             validate: Whether to validate profile before starting
             
         Returns:
@@ -101,26 +192,30 @@ class ProfileRunner:
             
             # Pre-start hook
             if self._plugin_loader:
-                self._plugin_loader.pre_profile_start(profile, self.runtime)
+                self._plugin_loader.pre_profile_start(profile, self._runtime_view)
+            
+            ld = profile.ld
+            maa = profile.maa
             
             # Start LD if configured
-            if profile.ld:
+            if ld:
                 self._emit("pre_ld_start", profile)
-                self._start_ld(profile.ld)
+                self._start_ld(ld)
             
-            # Wait if both LD and MAA are configured
-            if profile.ld and profile.maa:
+            # Wait for LD to boot if both LD and MAA are configured
+            if ld and maa:
                 self._emit("pre_wait_time", profile)
-                time.sleep(wait_time)
+                if _wait_for_ld_ready(ld, wait_time):
+                    self._emit("ld_ready", profile)
             
             # Start MAA if configured
-            if profile.maa:
+            if maa:
                 self._emit("pre_maa_launch", profile)
-                self._start_maa(profile.maa)
+                self._start_maa(maa)
             
             # Post-start hook
             if self._plugin_loader:
-                self._plugin_loader.post_profile_start(profile, self.runtime)
+                self._plugin_loader.post_profile_start(profile, self._runtime_view)
             
             return True
             
@@ -138,7 +233,7 @@ class ProfileRunner:
             profile: The profile that failed
         """
         if self._plugin_loader:
-            self._plugin_loader.post_profile_start(profile, self.runtime)
+            self._plugin_loader.post_profile_start(profile, self._runtime_view)
     
     def _start_ld(self, ld) -> None:
         """Start LD player.
@@ -147,10 +242,7 @@ class ProfileRunner:
             ld: LDModel instance
         """
         try:
-            if ld.index is not None:
-                os.system(f"ldpx console launch --index {ld.index}")
-            elif ld.name:
-                os.system(f"ldpx console launch --name {ld.name}")
+            _run_ldpx("launch", ld)
         except Exception as e:
             print(f"Error launching LD: {e}")
             raise
@@ -183,21 +275,24 @@ class ProfileRunner:
             
             # Pre-kill hook
             if self._plugin_loader:
-                self._plugin_loader.pre_profile_kill(profile, self.runtime)
+                self._plugin_loader.pre_profile_kill(profile, self._runtime_view)
+            
+            ld = profile.ld
+            maa = profile.maa
             
             # Kill MAA if configured
-            if profile.maa:
+            if maa:
                 self._emit("pre_maa_kill", profile)
-                self._kill_maa(profile.maa)
+                self._kill_maa(maa)
             
             # Kill LD if configured
-            if profile.ld:
+            if ld:
                 self._emit("pre_ld_kill", profile)
-                self._kill_ld(profile.ld)
+                self._kill_ld(ld)
             
             # Post-kill hook
             if self._plugin_loader:
-                self._plugin_loader.post_profile_kill(profile, self.runtime)
+                self._plugin_loader.post_profile_kill(profile, self._runtime_view)
             
             return True
             
@@ -211,6 +306,8 @@ class ProfileRunner:
         Args:
             maa: MaaModel instance
         """
+        from mxx.utils.kill import kill_processes_by_path
+        
         app_path = get_maa_app_path(maa)
         kill_processes_by_path(str(app_path))
     
@@ -221,13 +318,18 @@ class ProfileRunner:
             ld: LDModel instance
         """
         try:
-            if ld.index is not None:
-                os.system(f"ldpx console quit --index {ld.index}")
-            elif ld.name:
-                os.system(f"ldpx console quit --name {ld.name}")
+            _run_ldpx("quit", ld)
         except Exception as e:
             print(f"Error quitting LD: {e}")
 
 
-# Global runner instance
-runner = ProfileRunner()
+def __getattr__(name: str) -> Any:
+    """Create the global runner instance on first access.
+    
+    The instance is stored in the module globals, so later lookups are plain
+    attribute reads.
+    """
+    if name == "runner":
+        instance = globals()["runner"] = ProfileRunner()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,38 +19,54 @@ class BaseModel:
 
         self.extra = extra
 
+    @classmethod
+    def _field_spec(cls):
+        # {field_name: (resolved_type, is_basemodel)}, built once per class;
+        # read from cls.__dict__ so subclasses don't reuse a parent's table
+        spec = cls.__dict__.get("_field_spec_cache")
+        if spec is not None:
+            return spec
+
+        spec = {}
+        for name, f in cls.__dataclass_fields__.items():
+            field_type = f.type
+            
+            # Handle Optional types
+            origin = typing.get_origin(field_type)
+            if origin is typing.Union:
+                # Get the non-None type from Optional
+                args = typing.get_args(field_type)
+                field_type = next((arg for arg in args if arg is not type(None)), None)
+            
+            try:
+                is_model = field_type is not None and issubclass(field_type, BaseModel)
+            except TypeError:
+                # Not a class (e.g. list[str])
+                is_model = False
+            spec[name] = (field_type, is_model)
+
+        cls._field_spec_cache = spec
+        return spec
+
     @classmethod
     def create(cls, data : dict):
-        # Create a copy to avoid modifying original data
-        data = data.copy()
-        
-        for k, v in list(data.items()):
-            if k in cls.__dataclass_fields__:
-                field_type = cls.__dataclass_fields__[k].type
-                
-                # Handle Optional types
-                origin = typing.get_origin(field_type)
-                if origin is typing.Union:
-                    # Get the non-None type from Optional
-                    args = typing.get_args(field_type)
-                    field_type = next((arg for arg in args if arg is not type(None)), None)
-                
-                # Check if it's a BaseModel subclass and v is a dict
-                if field_type and isinstance(v, dict):
-                    try:
-                        if issubclass(field_type, BaseModel):
-                            data[k] = field_type.create(v)
-                    except TypeError:
-                        # Not a class, skip
-                        pass
+        # Split fields from extras in one pass; the input dict is not modified
+        spec = cls._field_spec()
+        valid_fields = {}
+        extra_fields = {}
+        for k, v in data.items():
+            field = spec.get(k)
+            if field is None:
+                extra_fields[k] = v
+                continue
+            field_type, is_model = field
+            # Nested models are built from their dict
+            valid_fields[k] = field_type.create(v) if is_model and isinstance(v, dict) else v
         
-        # Filter out extra fields that aren't in dataclass
-        valid_fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
         instance = cls(**valid_fields)
         
         # Store extra fields
-        extra_fields = {k: v for k, v in data.items() if k not in cls.__dataclass_fields__}
         if extra_fields:
             instance.extra = extra_fields
         
-        return instance
\ No newline at end of file
+        return instance
@@ -24,3 +24,14 @@ class MaaModel(BaseModel):
     fileConfig : MaaFileConfigModel = None
     parseConfig : MaaConfigParseModel = None
 
+    def __post_init__(self):
+        # Resolved paths as ((path, part), Path), filled in by
+        # mxx.core.parser; keyed so plugins rewriting path invalidate them
+        self._app_path = None
+        self._config_path = None
+
+    @property
+    def is_plugin_managed(self) -> bool:
+        # Paths like "scoop:app" are resolved by plugins, not the filesystem;
+        # computed on access because plugins rewrite path once resolved
+        return bool(self.path) and self.path.startswith("scoop")
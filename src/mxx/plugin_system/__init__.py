@@ -21,6 +21,7 @@ Example Plugin:
 Available Hooks:
     - pre_ld_start: Before LD player launches
     - pre_wait_time: Before waiting between LD and MAA
+    - ld_ready: LD finished booting before the wait time ran out
     - pre_maa_launch: Before MAA launches
     - pre_maa_kill: Before MAA is killed
     - pre_ld_kill: Before LD is killed
@@ -36,11 +37,19 @@ Plugin Methods:
 
 from mxx.plugin_system.interface import PluginInterface
 from mxx.plugin_system.plugin import MxxPlugin
-from mxx.plugin_system.loader import PluginLoader, plugin_loader
+from mxx.plugin_system.loader import PluginLoader, get_plugin_loader
 
 __all__ = [
     "PluginInterface",
     "MxxPlugin",
     "PluginLoader",
+    "get_plugin_loader",
     "plugin_loader",
 ]
+
+
+def __getattr__(name):
+    """Resolve plugin_loader lazily (see mxx.plugin_system.loader)."""
+    if name == "plugin_loader":
+        return get_plugin_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,71 @@
 """Plugin interface for extending MXX functionality."""
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import inspect
+import weakref
 
 if TYPE_CHECKING:
     from mxx.models.profile import MxxProfile
     import click
 
 
+# Parameter names by underlying function, so each hook's signature is
+# inspected once rather than on every call; weak keys let entries go away
+# with the plugin that defined them
+_sig_cache: "weakref.WeakKeyDictionary[Any, Optional[frozenset]]" = weakref.WeakKeyDictionary()
+
+# Cache marker for callables whose accepted names weren't computed yet
+_MISSING = object()
+
+
+def _inspect_params(func) -> Optional[frozenset]:
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        # No signature to filter against
+        return None
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
+    return frozenset(p.name for p in parameters)
+
+
+def accepted_params(func) -> Optional[frozenset]:
+    """Get the parameter names a callable accepts, cached per function.
+    
+    Args:
+        func: Function or bound method
+        
+    Returns:
+        Frozenset of parameter names, or None if the callable takes
+        **kwargs (or has no inspectable signature) and accepts any keyword
+    """
+    key = getattr(func, "__func__", func)
+    try:
+        params = _sig_cache.get(key, _MISSING)
+    except TypeError:
+        # Not weak-referenceable (e.g. a builtin); inspect without caching
+        return _inspect_params(func)
+    if params is _MISSING:
+        params = _sig_cache[key] = _inspect_params(func)
+    return params
+
+
+def filter_kwargs(func, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the keyword arguments a callable accepts.
+    
+    Args:
+        func: Function or bound method
+        kwargs: Candidate keyword arguments
+        
+    Returns:
+        kwargs itself if everything is accepted, otherwise a filtered copy
+    """
+    params = accepted_params(func)
+    if params is None:
+        return kwargs
+    return {key: value for key, value in kwargs.items() if key in params}
+
+
 class PluginInterface:
     """Base interface for MXX plugins.
     
@@ -140,6 +198,21 @@ class PluginInterface:
         """
         return {}
     
+    def get_profile_names(self, vars: Optional[Dict[str, str]] = None) -> Optional[List[str]]:
+        """Name the profiles this plugin provides without building them.
+        
+        Plugins whose profiles are expensive to build can implement this so
+        looking up a single profile only calls get_profiles() on the plugin
+        that owns it. When not implemented, get_profiles() is used instead.
+        
+        Args:
+            vars: Optional variables from --var options (if method accepts it)
+            
+        Returns:
+            List of profile names, or None to fall back to get_profiles()
+        """
+        return None
+    
     def hook(self, hook_name: str, *args, **kwargs) -> Any:
         """Generic hook dispatcher with signature inspection.
         
@@ -156,15 +229,5 @@ class PluginInterface:
         """
         func = getattr(self, f"hook_{hook_name}", None)
         if func and callable(func):
-            try:
-                sig = inspect.signature(func)
-                # Filter kwargs to only include parameters the method accepts
-                accepted_kwargs = {}
-                for key, value in kwargs.items():
-                    if key in sig.parameters:
-                        accepted_kwargs[key] = value
-                return func(*args, **accepted_kwargs)
-            except Exception:
-                # Fallback: try with all kwargs
-                return func(*args, **kwargs)
+            return func(*args, **filter_kwargs(func, kwargs))
         return None
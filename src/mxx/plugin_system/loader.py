@@ -1,35 +1,310 @@
 """Plugin loader for discovering and managing MXX plugins."""
 
+import inspect
+import json
+import logging
+import os
 import pkgutil
 import importlib
-import inspect
-from typing import List, Dict, Any, TYPE_CHECKING
+import sys
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Any, Iterator, Optional, TYPE_CHECKING
+from mxx.plugin_system.interface import PluginInterface, filter_kwargs
 from mxx.plugin_system.plugin import MxxPlugin
 
 if TYPE_CHECKING:
     from mxx.models.profile import MxxProfile
 
 
+# Interface methods that plugins may override
+_INTERFACE_HOOKS = (
+    "init",
+    "register_commands",
+    "pre_command",
+    "post_command",
+    "command_error",
+    "pre_profile_start",
+    "post_profile_start",
+    "pre_profile_kill",
+    "post_profile_kill",
+    "can_run_profile",
+    "can_kill_profile",
+    "get_profiles",
+    "get_profile_names",
+)
+
+
+# Plugin failures are reported here rather than printed; without any logging
+# configuration, warnings still reach stderr
+logger = logging.getLogger("mxx.plugins")
+
+# Entry point group installed plugins register their plugin object under
+_ENTRY_POINT_GROUP = "mxx.plugins"
+
+# Bump when the layout of plugins.json changes
+_CACHE_SCHEMA = 2
+
+
+def _implements(plugin: MxxPlugin, name: str) -> bool:
+    """Check whether a plugin provides its own implementation of a hook.
+    
+    Args:
+        plugin: Plugin instance
+        name: Method name (e.g., "pre_profile_start" or "hook_pre_ld_start")
+        
+    Returns:
+        True if the plugin overrides the interface default or defines the hook
+    """
+    method = getattr(type(plugin), name, None)
+    if method is None:
+        return callable(getattr(plugin, name, None))
+    return method is not getattr(PluginInterface, name, None)
+
+
+def _discovery_cache_path() -> str:
+    """Get the path of the plugin discovery cache file."""
+    from mxx.core.config import get_config_path
+    return os.path.join(get_config_path(), "cache", "plugins.json")
+
+
+def _search_path_stamps() -> List[List[Any]]:
+    """Stamp every sys.path entry with its modification time.
+    
+    Installing or removing a top-level package changes the mtime of the
+    directory it lives in, so equal stamps mean the set of importable
+    'mxxp_' packages is unchanged.
+    
+    Returns:
+        List of [path, mtime_ns or None] pairs in sys.path order
+    """
+    stamps = []
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        stamps.append([entry, mtime])
+    return stamps
+
+
+def _entry_point_targets() -> Dict[str, tuple[str, Optional[str]]]:
+    """Collect plugins declared as "mxx.plugins" entry points.
+    
+    Returns:
+        Mapping of plugin package name (e.g. "mxxp_scoop") to the
+        "module:attr" reference of its plugin object and the version of
+        the distribution declaring it
+    """
+    from importlib.metadata import entry_points
+    
+    targets = {}
+    for ep in entry_points(group=_ENTRY_POINT_GROUP):
+        version = ep.dist.version if ep.dist is not None else None
+        targets.setdefault(ep.module.partition(".")[0], (ep.value, version))
+    return targets
+
+
+def _default_target(name: str) -> str:
+    """Get the "module:attr" reference of a scanned 'mxxp_' package's plugin."""
+    return f"{name}.__plugin__:plugin"
+
+
+def _import_target(target: str) -> tuple[Any, Any]:
+    """Import a "module:attr" reference.
+    
+    Returns:
+        Tuple of (module, referenced object or None)
+    """
+    module_name, _, attr = target.partition(":")
+    module = importlib.import_module(module_name.strip())
+    return module, getattr(module, attr.strip() or "plugin", None)
+
+
+def _cache_header() -> Dict[str, Any]:
+    """Describe the host code the cached plugin hook lists were computed with.
+    
+    Which hooks a plugin implements also depends on mxx itself (the
+    interface hooks and base class defaults), so cached entries are only
+    reused while this header is unchanged.
+    
+    Returns:
+        Cache schema, installed mxx version and interface hook names
+    """
+    from importlib.metadata import PackageNotFoundError, version
+    
+    try:
+        mxx_version = version("mxx")
+    except PackageNotFoundError:
+        mxx_version = None
+    return {"schema": _CACHE_SCHEMA, "mxx": mxx_version, "hooks": list(_INTERFACE_HOOKS)}
+
+
+def _package_stamp(name: str) -> Optional[List[int]]:
+    """Stamp a plugin package's files without importing it.
+    
+    Every file below the package directory counts (not only the module
+    holding the plugin), so edits to helper modules or base classes
+    shipped with the plugin invalidate its cached hooks too.
+    
+    Args:
+        name: Top-level package or module name (e.g. "mxxp_scoop")
+        
+    Returns:
+        [sum of mtime_ns, sum of sizes, file count], or None if the
+        package can't be found
+    """
+    from importlib.util import find_spec
+    
+    try:
+        spec = find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    
+    if not spec.submodule_search_locations:
+        # Single-file module
+        try:
+            st = os.stat(spec.origin)
+        except (OSError, TypeError):
+            return None
+        return [st.st_mtime_ns, st.st_size, 1]
+    
+    mtimes = sizes = count = 0
+    
+    stack = list(spec.submodule_search_locations)
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        mtimes += st.st_mtime_ns
+                        sizes += st.st_size
+                        count += 1
+        except OSError:
+            continue
+    return [mtimes, sizes, count]
+
+
+def _load_discovery_cache() -> Dict[str, Any]:
+    """Read the plugin discovery cache, or an empty dict if unusable."""
+    try:
+        with open(_discovery_cache_path(), 'rb') as f:
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_discovery_cache(cache: Dict[str, Any]) -> None:
+    """Write the plugin discovery cache atomically; failures are ignored."""
+    path = _discovery_cache_path()
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+class LazyPlugin:
+    """Stand-in for a plugin whose hooks are known from the discovery cache.
+    
+    The plugin module is imported the first time any attribute other than
+    its name is needed, so plugins whose hooks never fire are never imported.
+    """
+    
+    _plugin = None
+    
+    def __init__(self, name: str, target: Optional[str] = None):
+        """Initialize the stand-in.
+        
+        Args:
+            name: Plugin package name (e.g. "mxxp_scoop")
+            target: "module:attr" reference of the plugin object
+                (defaults to the package's __plugin__:plugin)
+        """
+        self.name = name
+        self.target = target or _default_target(name)
+    
+    @property
+    def plugin(self) -> MxxPlugin:
+        """Import the plugin module on first access and return its plugin."""
+        if self._plugin is None:
+            _, plugin = _import_target(self.target)
+            if not isinstance(plugin, MxxPlugin):
+                raise ImportError(f"{self.target} no longer refers to a plugin")
+            self._plugin = plugin
+        return self._plugin
+    
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.plugin, attr)
+
+
+class _LazyMethod:
+    """Dispatch-table entry that resolves a LazyPlugin hook when called."""
+    
+    def __init__(self, plugin: LazyPlugin, name: str):
+        self._lazy = plugin
+        self._name = name
+    
+    @property
+    def __signature__(self) -> inspect.Signature:
+        # Lets filter_kwargs filter kwargs against the real hook
+        return inspect.signature(getattr(self._lazy.plugin, self._name))
+    
+    def __call__(self, *args, **kwargs) -> Any:
+        return getattr(self._lazy.plugin, self._name)(*args, **kwargs)
+
+
 class PluginLoader:
     """Discovers and manages MXX plugins."""
     
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        """Singleton pattern to avoid re-discovering plugins."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    # Hooks read these on every call; slots keep them out of a per-instance dict
+    __slots__ = (
+        "plugins",
+        "_hooks",
+        "_dispatch",
+        "_veto_counts",
+        "_plugin_profiles",
+        "_profile_owners",
+        "_profiles_by_plugin",
+        "context",
+        "_plugins_inited",
+        "_commands_registered",
+        "_commands_done",
+        "_builtin_commands",
+        "_plugin_names",
+        "_discovery_cache",
+    )
     
     def __init__(self):
-        """Initialize the plugin loader and discover plugins."""
-        if not self._initialized:
-            self.plugins: List[MxxPlugin] = []
-            self._plugin_profiles: Dict[str, "MxxProfile"] = {}
-            self.context: Dict[str, Any] = {}  # Runtime context storage
-            self._discover_plugins()
-            PluginLoader._initialized = True
+        """Initialize the plugin loader and discover plugins.
+        
+        Use get_plugin_loader() for the shared instance; constructing a
+        loader directly always runs discovery again.
+        """
+        self.plugins: List[MxxPlugin] = []
+        self._hooks: Dict[str, List[MxxPlugin]] = {}  # Method name -> implementing plugins
+        self._dispatch: Dict[str, List[Callable]] = {}  # Method name -> bound implementations
+        self._veto_counts: Dict[Callable, int] = {}  # Check method -> times it returned False
+        self._plugin_profiles: Dict[str, "MxxProfile"] = {}
+        self._profile_owners: Optional[Dict[str, MxxPlugin]] = None  # Profile name -> plugin
+        self._profiles_by_plugin: Dict[MxxPlugin, Dict[str, "MxxProfile"]] = {}  # get_profiles() results
+        self.context: Dict[str, Any] = {}  # Runtime context storage
+        self._plugins_inited = False  # Set once init() has run
+        self._commands_registered = False  # Set once every plugin registered its commands
+        self._commands_done: set = set()  # Plugins whose register_commands has run
+        self._builtin_commands: Optional[frozenset] = None  # Root commands before any plugin's
+        self._plugin_names: Dict[Any, str] = {}  # Discovered plugin -> package name
+        self._discovery_cache: Dict[str, Any] = {}  # Discovery cache as last loaded/saved
+        self._discover_plugins()
     
     def set_context(self, context: Dict[str, Any]) -> None:
         """Set the runtime context.
@@ -39,14 +314,74 @@ class PluginLoader:
         """
         self.context = context
     
+    @contextmanager
+    def scoped_context(self, **updates: Any) -> Iterator[Dict[str, Any]]:
+        """Overlay keys on the runtime context for the duration of a block.
+        
+        Only the given keys are written, and each is restored (or removed)
+        when the block exits, so nothing else in the context is copied.
+        
+        Args:
+            **updates: Context keys to set (e.g. profile_name="daily")
+            
+        Yields:
+            The updated context
+        """
+        missing = object()
+        saved = {key: self.context.get(key, missing) for key in updates}
+        self.context.update(updates)
+        try:
+            yield self.context
+        finally:
+            for key, value in saved.items():
+                if value is missing:
+                    self.context.pop(key, None)
+                else:
+                    self.context[key] = value
+    
+    def register_plugin(self, plugin: MxxPlugin) -> None:
+        """Add a plugin and index the hooks it implements.
+        
+        Args:
+            plugin: Plugin instance to register
+        """
+        names = set(_INTERFACE_HOOKS)
+        names.update(n for n in dir(plugin) if n.startswith("hook_"))
+        self._index_plugin(plugin, [name for name in sorted(names) if _implements(plugin, name)])
+    
+    def _index_plugin(self, plugin: Any, hooks: List[str]) -> None:
+        """Add a plugin (or LazyPlugin) under the hooks it implements.
+        
+        Args:
+            plugin: Plugin instance or LazyPlugin stand-in
+            hooks: Names of the hooks it implements
+        """
+        self.plugins.append(plugin)
+        lazy = isinstance(plugin, LazyPlugin)
+        for name in hooks:
+            self._hooks.setdefault(name, []).append(plugin)
+            method = _LazyMethod(plugin, name) if lazy else getattr(plugin, name)
+            self._dispatch.setdefault(name, []).append(method)
+    
+    def has_hook(self, name: str) -> bool:
+        """Check if any plugin implements the given hook.
+        
+        Args:
+            name: Method name (e.g., "pre_profile_start" or "hook_pre_ld_start")
+            
+        Returns:
+            True if at least one plugin implements it
+        """
+        return name in self._hooks
+    
     def _discover_plugins(self) -> None:
         """Discover and load all available plugins.
         
-        Searches for installed packages starting with 'mxxp_' and loads
-        the plugin instance from their __plugin__ module.
-        Also searches in cwd/plugins/ directory.
+        Installed plugins are found through their "mxx.plugins" entry
+        points. Packages starting with 'mxxp_' that don't declare one are
+        still found by scanning sys.path, loading the plugin instance from
+        their __plugin__ module. Also searches in cwd/plugins/ directory.
         """
-        import sys
         from pathlib import Path
         
         # Add cwd/plugins to search path
@@ -54,17 +389,65 @@ class PluginLoader:
         if plugins_dir.exists() and str(plugins_dir) not in sys.path:
             sys.path.insert(0, str(plugins_dir))
         
-        for _, name, _ in pkgutil.iter_modules():
-            if name.startswith("mxxp_"):
-                try:
-                    module = importlib.import_module(f"{name}.__plugin__")
-                    if hasattr(module, "plugin") and isinstance(module.plugin, MxxPlugin):
-                        self.plugins.append(module.plugin)
-                        print(f"Loaded plugin: {name}")
-                except ImportError:
-                    pass
-                except Exception as e:
-                    print(f"Warning: Failed to load plugin {name}: {e}")
+        cache = _load_discovery_cache()
+        stamps = cache.get("paths")
+        names = cache.get("plugins")
+        changed = False
+        
+        # Entry points take precedence; 'mxxp_' packages without one are
+        # still picked up by the sys.path scan, which only runs again when
+        # a sys.path entry changed since the last run
+        targets = _entry_point_targets()
+        current = _search_path_stamps()
+        if stamps != current or not isinstance(names, list):
+            names = [name for _, name, _ in pkgutil.iter_modules() if name.startswith("mxxp_")]
+            stamps = current
+            changed = True
+        for name in names:
+            targets.setdefault(name, (_default_target(name), None))
+        
+        # Plugins whose distribution version and package files are unchanged
+        # are registered from their cached hook names and only imported
+        # when a hook is called
+        header = _cache_header()
+        cached_modules = cache.get("modules") if isinstance(cache.get("modules"), dict) else {}
+        if cache.get("header") != header:
+            # Written by another mxx version; hook lists may be stale
+            cached_modules = {}
+            changed = True
+        modules = {}
+        for name, (target, version) in targets.items():
+            stamp = _package_stamp(name)
+            entry = cached_modules.get(name)
+            if (entry and stamp is not None and entry.get("target") == target
+                    and entry.get("version") == version and entry.get("stamp") == stamp):
+                modules[name] = entry
+                lazy = LazyPlugin(name, target)
+                self._plugin_names[lazy] = name
+                self._index_plugin(lazy, entry.get("hooks", []))
+                continue
+            
+            changed = True
+            try:
+                _, plugin = _import_target(target)
+                if isinstance(plugin, MxxPlugin):
+                    self.register_plugin(plugin)
+                    self._plugin_names[plugin] = name
+                    print(f"Loaded plugin: {name}")
+                    modules[name] = {
+                        "target": target,
+                        "version": version,
+                        "stamp": stamp,
+                        "hooks": [hook for hook, plugins in self._hooks.items() if plugin in plugins],
+                    }
+            except ImportError:
+                pass
+            except Exception as e:
+                logger.warning("Failed to load plugin %s: %s", name, e)
+        
+        self._discovery_cache = {"header": header, "paths": stamps, "plugins": names, "modules": modules}
+        if changed or len(modules) != len(cached_modules):
+            _save_discovery_cache(self._discovery_cache)
     
     def _call_with_inspection(self, method, *args, **kwargs) -> Any:
         """Call a method with signature inspection to pass only accepted parameters.
@@ -77,19 +460,7 @@ class PluginLoader:
         Returns:
             Method result
         """
-        try:
-            sig = inspect.signature(method)
-            
-            # Filter kwargs to only include parameters the method accepts
-            accepted_kwargs = {}
-            for key, value in kwargs.items():
-                if key in sig.parameters:
-                    accepted_kwargs[key] = value
-            
-            return method(*args, **accepted_kwargs)
-        except Exception:
-            # Fallback: try with all kwargs
-            return method(*args, **kwargs)
+        return method(*args, **filter_kwargs(method, kwargs))
     
     def emit(self, hook_name: str, *args, **kwargs) -> None:
         """Emit a hook event to all plugins.
@@ -99,13 +470,23 @@ class PluginLoader:
             *args: Positional arguments for the hook
             **kwargs: Keyword arguments for the hook (including vars if available)
         """
-        for plugin in self.plugins:
+        for method in self._dispatch.get(f"hook_{hook_name}", ()):
             try:
-                method = getattr(plugin, f"hook_{hook_name}", None)
-                if method and callable(method):
-                    self._call_with_inspection(method, *args, **kwargs)
+                self._call_with_inspection(method, *args, **kwargs)
             except Exception as e:
-                print(f"Warning: Plugin hook '{hook_name}' failed: {e}")
+                logger.warning("Plugin hook %r failed: %s", hook_name, e)
+    
+    def ensure_init(self, ctx=None) -> None:
+        """Initialize all plugins unless that has already happened.
+        
+        Called right before the first command runs, so invocations that never
+        reach a command (e.g. --help) skip plugin initialization entirely.
+        
+        Args:
+            ctx: Optional Click context
+        """
+        if not self._plugins_inited:
+            self.init(ctx)
     
     def init(self, ctx=None) -> None:
         """Initialize all plugins with context vars and Click context.
@@ -113,12 +494,59 @@ class PluginLoader:
         Args:
             ctx: Optional Click context
         """
+        self._plugins_inited = True
         vars_dict = self.context.get('vars', {})
-        for plugin in self.plugins:
+        for plugin in self._hooks.get("init", ()):
             try:
                 self._call_with_inspection(plugin.init, vars=vars_dict, ctx=ctx)
             except Exception as e:
-                print(f"Warning: Plugin init failed: {e}")
+                logger.warning("Plugin init failed: %s", e)
+    
+    def _command_manifest(self) -> Optional[Dict[str, List[Any]]]:
+        """Map root command names to the plugins known to register them.
+        
+        The names come from the discovery cache, recorded the last time each
+        plugin's register_commands ran.
+        
+        Returns:
+            Command name -> plugins in registration order, or None if the
+            commands of some plugin aren't known
+        """
+        modules = self._discovery_cache.get("modules") or {}
+        manifest: Dict[str, List[Any]] = {}
+        for plugin in self._hooks.get("register_commands", ()):
+            entry = modules.get(self._plugin_names.get(plugin))
+            if entry is None or not isinstance(entry.get("commands"), list):
+                return None
+            for name in entry["commands"]:
+                manifest.setdefault(name, []).append(plugin)
+        return manifest
+    
+    def ensure_commands(self, cli_group, name: Optional[str] = None) -> bool:
+        """Register plugin commands that haven't been registered yet.
+        
+        Called by Click groups when a command is looked up or listed, so
+        invocations of built-in commands don't run every plugin's
+        register_commands. Given a command name, only the plugins the
+        discovery cache lists for that name are asked (and imported); when
+        that isn't known yet, every remaining plugin registers.
+        
+        Args:
+            cli_group: Root Click group to register commands with
+            name: Root command being looked up, or None for all commands
+            
+        Returns:
+            True if any plugin registered commands in this call
+        """
+        if self._commands_registered:
+            return False
+        if name is not None:
+            manifest = self._command_manifest()
+            if manifest is not None:
+                return self._register_commands_from(manifest.get(name, ()), cli_group)
+        registered = self._register_commands_from(self._hooks.get("register_commands", ()), cli_group)
+        self._commands_registered = True
+        return registered
     
     def register_commands(self, cli_group) -> None:
         """Register commands from all plugins with context vars.
@@ -126,12 +554,53 @@ class PluginLoader:
         Args:
             cli_group: Click group to register commands with
         """
+        self._register_commands_from(self._hooks.get("register_commands", ()), cli_group)
+        self._commands_registered = True
+    
+    def _register_commands_from(self, plugins, cli_group) -> bool:
+        """Run register_commands for the given plugins that haven't run it.
+        
+        The root commands each plugin adds or replaces are recorded in the
+        discovery cache for later lookups, and replacing a built-in command
+        is reported.
+        
+        Args:
+            plugins: Plugins to register, in registration order
+            cli_group: Click group to register commands with
+            
+        Returns:
+            True if any plugin was asked to register commands
+        """
+        commands = getattr(cli_group, "commands", {})
+        if self._builtin_commands is None:
+            self._builtin_commands = frozenset(commands)
+        modules = self._discovery_cache.get("modules") or {}
         vars_dict = self.context.get('vars', {})
-        for plugin in self.plugins:
+        registered = updated = False
+        for plugin in plugins:
+            if plugin in self._commands_done:
+                continue
+            self._commands_done.add(plugin)
+            registered = True
+            before = dict(commands)
             try:
                 self._call_with_inspection(plugin.register_commands, cli_group, vars=vars_dict)
             except Exception as e:
-                print(f"Warning: Plugin register_commands failed: {e}")
+                logger.warning("Plugin register_commands failed: %s", e)
+                continue
+            
+            added = [name for name, command in commands.items() if before.get(name) is not command]
+            for name in added:
+                if name in self._builtin_commands:
+                    logger.warning("Plugin command %r replaces the built-in command", name)
+            entry = modules.get(self._plugin_names.get(plugin))
+            if entry is not None and entry.get("commands") != added:
+                entry["commands"] = added
+                updated = True
+        
+        if updated:
+            _save_discovery_cache(self._discovery_cache)
+        return registered
     
     def pre_command(self, command_name: str, ctx) -> None:
         """Call pre_command on all plugins.
@@ -140,11 +609,11 @@ class PluginLoader:
             command_name: Name of the command being executed
             ctx: Click context
         """
-        for plugin in self.plugins:
+        for plugin in self._hooks.get("pre_command", ()):
             try:
                 self._call_with_inspection(plugin.pre_command, command_name, ctx)
             except Exception as e:
-                print(f"Warning: Plugin pre_command failed: {e}")
+                logger.warning("Plugin pre_command failed: %s", e)
     
     def post_command(self, command_name: str, ctx, result) -> None:
         """Call post_command on all plugins.
@@ -154,11 +623,11 @@ class PluginLoader:
             ctx: Click context
             result: Return value from the command
         """
-        for plugin in self.plugins:
+        for plugin in self._hooks.get("post_command", ()):
             try:
                 self._call_with_inspection(plugin.post_command, command_name, ctx, result)
             except Exception as e:
-                print(f"Warning: Plugin post_command failed: {e}")
+                logger.warning("Plugin post_command failed: %s", e)
     
     def command_error(self, command_name: str, ctx, error: Exception) -> None:
         """Call command_error on all plugins.
@@ -168,28 +637,69 @@ class PluginLoader:
             ctx: Click context
             error: Exception that was raised
         """
-        for plugin in self.plugins:
+        for plugin in self._hooks.get("command_error", ()):
             try:
                 self._call_with_inspection(plugin.command_error, command_name, ctx, error)
             except Exception as e:
-                print(f"Warning: Plugin command_error handler failed: {e}")
+                logger.warning("Plugin command_error handler failed: %s", e)
 
-    def pre_profile_start(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> None:
-        """Call pre_profile_start on all plugins.
+    def _call_profile_hook(self, name: str, profile: "MxxProfile", ctx: Dict[str, Any],
+                           check: bool = False) -> bool:
+        """Call a profile hook on every plugin that implements it.
         
         Args:
-            profile: Profile being started
-            ctx: Runtime context
+            name: Hook method name (e.g. "pre_profile_start")
+            profile: Profile the hook is about
+            ctx: Runtime context, merged over the stored context
+            check: Treat the hook as a veto and stop at the first falsy result;
+                methods that vetoed before are asked first
+            
+        Returns:
+            False if a check hook vetoed, True otherwise
         """
+        methods = self._dispatch.get(name)
+        if not methods:
+            return True
+        
         # Merge stored context (including vars and profile_name) with runtime context
         merged_ctx = {**self.context, **ctx}
         vars_dict = merged_ctx.get('vars', {})
         
-        for plugin in self.plugins:
+        for method in methods:
             try:
-                self._call_with_inspection(plugin.pre_profile_start, profile, merged_ctx, vars=vars_dict)
+                result = self._call_with_inspection(method, profile, merged_ctx, vars=vars_dict)
+                if check and not result:
+                    self._record_veto(methods, method)
+                    return False
             except Exception as e:
-                print(f"Warning: Plugin pre_profile_start failed: {e}")
+                logger.warning("Plugin %s%s failed: %s", name, " check" if check else "", e)
+        return True
+    
+    def _record_veto(self, methods: List[Callable], method: Callable) -> None:
+        """Count a veto and move the method ahead of those that veto less often.
+        
+        Args:
+            methods: Dispatch list the method belongs to (reordered in place)
+            method: Check method that returned False
+        """
+        counts = self._veto_counts
+        counts[method] = count = counts.get(method, 0) + 1
+        index = methods.index(method)
+        # Stable move: only past methods with a strictly lower count
+        target = index
+        while target > 0 and counts.get(methods[target - 1], 0) < count:
+            target -= 1
+        if target != index:
+            methods.insert(target, methods.pop(index))
+    
+    def pre_profile_start(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> None:
+        """Call pre_profile_start on all plugins.
+        
+        Args:
+            profile: Profile being started
+            ctx: Runtime context
+        """
+        self._call_profile_hook("pre_profile_start", profile, ctx)
     
     def post_profile_start(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> None:
         """Call post_profile_start on all plugins.
@@ -198,15 +708,7 @@ class PluginLoader:
             profile: Profile that was started
             ctx: Runtime context
         """
-        # Merge stored context (including vars and profile_name) with runtime context
-        merged_ctx = {**self.context, **ctx}
-        vars_dict = merged_ctx.get('vars', {})
-        
-        for plugin in self.plugins:
-            try:
-                self._call_with_inspection(plugin.post_profile_start, profile, merged_ctx, vars=vars_dict)
-            except Exception as e:
-                print(f"Warning: Plugin post_profile_start failed: {e}")
+        self._call_profile_hook("post_profile_start", profile, ctx)
     
     def pre_profile_kill(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> None:
         """Call pre_profile_kill on all plugins.
@@ -215,15 +717,7 @@ class PluginLoader:
             profile: Profile being killed
             ctx: Runtime context
         """
-        # Merge stored context with runtime context
-        merged_ctx = {**self.context, **ctx}
-        vars_dict = merged_ctx.get('vars', {})
-        
-        for plugin in self.plugins:
-            try:
-                self._call_with_inspection(plugin.pre_profile_kill, profile, merged_ctx, vars=vars_dict)
-            except Exception as e:
-                print(f"Warning: Plugin pre_profile_kill failed: {e}")
+        self._call_profile_hook("pre_profile_kill", profile, ctx)
     
     def post_profile_kill(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> None:
         """Call post_profile_kill on all plugins.
@@ -232,15 +726,7 @@ class PluginLoader:
             profile: Profile that was killed
             ctx: Runtime context
         """
-        # Merge stored context with runtime context
-        merged_ctx = {**self.context, **ctx}
-        vars_dict = merged_ctx.get('vars', {})
-        
-        for plugin in self.plugins:
-            try:
-                self._call_with_inspection(plugin.post_profile_kill, profile, merged_ctx, vars=vars_dict)
-            except Exception as e:
-                print(f"Warning: Plugin post_profile_kill failed: {e}")
+        self._call_profile_hook("post_profile_kill", profile, ctx)
     
     def can_run_profile(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> bool:
         """Check if profile can run via all plugins.
@@ -254,18 +740,7 @@ class PluginLoader:
         Returns:
             True if all plugins allow running, False otherwise
         """
-        # Merge stored context with runtime context
-        merged_ctx = {**self.context, **ctx}
-        vars_dict = merged_ctx.get('vars', {})
-        
-        for plugin in self.plugins:
-            try:
-                result = self._call_with_inspection(plugin.can_run_profile, profile, merged_ctx, vars=vars_dict)
-                if not result:
-                    return False
-            except Exception as e:
-                print(f"Warning: Plugin can_run_profile check failed: {e}")
-        return True
+        return self._call_profile_hook("can_run_profile", profile, ctx, check=True)
     
     def can_kill_profile(self, profile: "MxxProfile", ctx: Dict[str, Any]) -> bool:
         """Check if profile can be killed via all plugins.
@@ -279,45 +754,82 @@ class PluginLoader:
         Returns:
             True if all plugins allow killing, False otherwise
         """
-        # Merge stored context with runtime context
-        merged_ctx = {**self.context, **ctx}
-        vars_dict = merged_ctx.get('vars', {})
+        return self._call_profile_hook("can_kill_profile", profile, ctx, check=True)
+    
+    def _load_profiles_from(self, plugin: MxxPlugin) -> Dict[str, "MxxProfile"]:
+        """Call get_profiles() on one plugin, reusing the result afterwards.
         
-        for plugin in self.plugins:
-            try:
-                result = self._call_with_inspection(plugin.can_kill_profile, profile, merged_ctx, vars=vars_dict)
-                if not result:
-                    return False
-            except Exception as e:
-                print(f"Warning: Plugin can_kill_profile check failed: {e}")
-        return True
+        Args:
+            plugin: Plugin providing profiles
+            
+        Returns:
+            The profiles it provided (empty on failure)
+        """
+        if plugin in self._profiles_by_plugin:
+            return self._profiles_by_plugin[plugin]
+        
+        vars_dict = self.context.get('vars', {})
+        try:
+            profiles = self._call_with_inspection(plugin.get_profiles, vars=vars_dict) or {}
+        except Exception as e:
+            logger.warning("Failed to load profiles from plugin: %s", e)
+            profiles = {}
+        self._profiles_by_plugin[plugin] = profiles
+        if profiles:
+            self._plugin_profiles.update(profiles)
+            owner = plugin.plugin if isinstance(plugin, LazyPlugin) else plugin
+            print(f"Loaded {len(profiles)} profile(s) from plugin: {owner.__class__.__name__}")
+        return profiles
     
     def load_plugin_profiles(self) -> Dict[str, "MxxProfile"]:
         """Load profiles contributed by plugins.
         
         Calls get_profiles() on each plugin and aggregates the results.
+        This builds every plugin profile; use has_profile/get_profile to
+        resolve a single name.
         
         Returns:
             Dictionary mapping profile names to MxxProfile instances
         """
-        if self._plugin_profiles:
-            return self._plugin_profiles
-        
-        vars_dict = self.context.get('vars', {})
-        for plugin in self.plugins:
-            try:
-                profiles = self._call_with_inspection(plugin.get_profiles, vars=vars_dict)
-                if profiles:
-                    self._plugin_profiles.update(profiles)
-                    print(f"Loaded {len(profiles)} profile(s) from plugin: {plugin.__class__.__name__}")
-            except Exception as e:
-                print(f"Warning: Failed to load profiles from plugin: {e}")
+        for plugin in self._hooks.get("get_profiles", ()):
+            self._load_profiles_from(plugin)
         
         return self._plugin_profiles
     
+    def load_plugin_profile_names(self) -> Dict[str, MxxPlugin]:
+        """Index plugin profile names without building the profiles.
+        
+        Plugins implementing get_profile_names() are only asked for names;
+        others fall back to get_profiles().
+        
+        Returns:
+            Dictionary mapping profile names to the plugin providing them
+        """
+        if self._profile_owners is not None:
+            return self._profile_owners
+        
+        owners = {}
+        vars_dict = self.context.get('vars', {})
+        for plugin in self._hooks.get("get_profiles", ()):
+            names = None
+            if _implements(plugin, "get_profile_names"):
+                try:
+                    names = self._call_with_inspection(plugin.get_profile_names, vars=vars_dict)
+                except Exception as e:
+                    logger.warning("Failed to list profiles from plugin: %s", e)
+            if names is None:
+                names = self._load_profiles_from(plugin)
+            for name in names:
+                owners.setdefault(name, plugin)
+        
+        self._profile_owners = owners
+        return owners
+    
     def get_profile(self, name: str) -> "MxxProfile":
         """Get a profile by name from plugin-contributed profiles.
         
+        Only the plugin that provides the name has its profiles built.
+        
         Args:
             name: Profile name
             
@@ -327,8 +839,10 @@ class PluginLoader:
         Raises:
             KeyError: If profile not found
         """
-        if not self._plugin_profiles:
-            self.load_plugin_profiles()
+        if name not in self._plugin_profiles:
+            plugin = self.load_plugin_profile_names().get(name)
+            if plugin is not None:
+                self._load_profiles_from(plugin)
         
         return self._plugin_profiles[name]
     
@@ -341,11 +855,28 @@ class PluginLoader:
         Returns:
             True if profile exists in plugins, False otherwise
         """
-        if not self._plugin_profiles:
-            self.load_plugin_profiles()
-        
-        return name in self._plugin_profiles
+        return name in self._plugin_profiles or name in self.load_plugin_profile_names()
+
+_instance: Optional[PluginLoader] = None
+
+
+def get_plugin_loader() -> PluginLoader:
+    """Get the shared plugin loader, discovering plugins on first call.
+    
+    Returns:
+        The process-wide PluginLoader instance
+    """
+    global _instance
+    if _instance is None:
+        _instance = PluginLoader()
+    return _instance
 
 
-# Global plugin loader instance
-plugin_loader = PluginLoader()
+def __getattr__(name: str) -> Any:
+    """Create the global plugin loader instance on first access.
+    
+    Importing this module therefore never triggers plugin discovery.
+    """
+    if name == "plugin_loader":
+        return get_plugin_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
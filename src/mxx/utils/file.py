@@ -1,11 +1,69 @@
 """File utilities for filtering, zipping, and loading config files."""
 
+import functools
+import os
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 import zipfile
 import fnmatch
 
 
+def _compile_patterns(patterns: List[str]) -> Callable[[str, str], bool]:
+    """Combine glob patterns into one matcher for (relative path, file name).
+    
+    A pattern matches if it matches either the relative path or the bare
+    file name. The name only needs its own test for patterns that can match
+    it without matching the path: those that neither contain a separator
+    nor start with '*' (which already absorbs any directory prefix).
+    Patterns are case-normalized like fnmatch.fnmatch does, so matching
+    stays case-insensitive on Windows.
+    
+    Args:
+        patterns: Glob patterns
+        
+    Returns:
+        Function taking the case-normalized relative path and file name
+    """
+    def combine(pats: List[str]) -> Callable[[str], Optional[re.Match]]:
+        return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in pats)).match
+    
+    patterns = [os.path.normcase(p) for p in patterns]
+    name_only = [p for p in patterns if not p.startswith("*") and os.sep not in p and "/" not in p]
+    match_path = combine(patterns)
+    if not name_only:
+        return lambda rel_path, name: match_path(rel_path) is not None
+    
+    match_name = combine(name_only)
+    return lambda rel_path, name: match_path(rel_path) is not None or (
+        rel_path is not name and match_name(name) is not None
+    )
+
+
+def _walk_files(directory: Path) -> Iterator[Tuple[str, str, str]]:
+    """Recursively yield files below a directory using os.scandir.
+    
+    Args:
+        directory: Directory to walk
+        
+    Yields:
+        Tuples of (relative path, file name, full path)
+    """
+    stack = [(str(directory), "")]
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    rel_path = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel_path + os.sep))
+                    elif entry.is_file():
+                        yield rel_path, entry.name, entry.path
+        except OSError:
+            continue
+
+
 def filter_files(
     directory: Path,
     include_patterns: List[str] = None,
@@ -24,56 +82,60 @@ def filter_files(
     if not directory.exists():
         return []
     
-    all_files = [f for f in directory.rglob("*") if f.is_file()]
-    
-    # Apply include patterns
-    if include_patterns:
-        included = set()
-        for pattern in include_patterns:
-            for file in all_files:
-                rel_path = file.relative_to(directory)
-                if fnmatch.fnmatch(str(rel_path), pattern) or fnmatch.fnmatch(file.name, pattern):
-                    included.add(file)
-        all_files = list(included)
-    
-    # Apply exclude patterns
-    if exclude_patterns:
-        filtered = []
-        for file in all_files:
-            rel_path = file.relative_to(directory)
-            excluded = False
-            for pattern in exclude_patterns:
-                if fnmatch.fnmatch(str(rel_path), pattern) or fnmatch.fnmatch(file.name, pattern):
-                    excluded = True
-                    break
-            if not excluded:
-                filtered.append(file)
-        all_files = filtered
-    
-    return all_files
+    include = _compile_patterns(include_patterns) if include_patterns else None
+    exclude = _compile_patterns(exclude_patterns) if exclude_patterns else None
+    
+    files = []
+    for rel_path, name, full_path in _walk_files(directory):
+        name = os.path.normcase(name)
+        # Top-level files share one string so the name test can be skipped
+        rel_path = os.path.normcase(rel_path) if len(rel_path) != len(name) else name
+        # Excludes are checked first so excluded files skip the include test
+        if exclude and exclude(rel_path, name):
+            continue
+        if include and not include(rel_path, name):
+            continue
+        files.append(Path(full_path))
+    
+    return files
 
 
-def load_config_file(file_path: Path) -> Dict[str, Any]:
-    """Load a config file (supports .toml and .json).
+@functools.lru_cache(maxsize=None)
+def _config_codec(suffix: str) -> Tuple[Callable, Callable]:
+    """Get the (load, save) functions for a config file suffix.
+    
+    The nofuss module is imported on first use of each suffix and the
+    functions are reused afterwards.
     
     Args:
-        file_path: Path to config file
+        suffix: Lowercase file suffix (e.g. ".toml")
         
     Returns:
-        Dictionary with file contents
+        Tuple of (load(path), save(data, path))
     """
-    suffix = file_path.suffix.lower()
-    
     if suffix == '.toml':
-        from mxx.utils.nofuss.toml import load_toml
-        return load_toml(str(file_path))
+        from mxx.utils.nofuss.toml import load_toml, save_toml
+        return load_toml, save_toml
     elif suffix == '.json':
-        from mxx.utils.nofuss.json import load_json
-        return load_json(str(file_path))
+        from mxx.utils.nofuss.json import load_json, save_json
+        return load_json, save_json
     else:
         raise ValueError(f"Unsupported file type: {suffix}")
 
 
+def load_config_file(file_path: Path) -> Dict[str, Any]:
+    """Load a config file (supports .toml and .json).
+    
+    Args:
+        file_path: Path to config file
+        
+    Returns:
+        Dictionary with file contents
+    """
+    load, _ = _config_codec(file_path.suffix.lower())
+    return load(str(file_path))
+
+
 def save_config_file(file_path: Path, data: Dict[str, Any]) -> None:
     """Save a config file (supports .toml and .json).
     
@@ -81,19 +143,12 @@ def save_config_file(file_path: Path, data: Dict[str, Any]) -> None:
         file_path: Path to config file
         data: Dictionary to save
     """
-    suffix = file_path.suffix.lower()
+    _, save = _config_codec(file_path.suffix.lower())
     
     # Ensure parent directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    if suffix == '.toml':
-        from mxx.utils.nofuss.toml import save_toml
-        save_toml(data, str(file_path))
-    elif suffix == '.json':
-        from mxx.utils.nofuss.json import save_json
-        save_json(data, str(file_path))
-    else:
-        raise ValueError(f"Unsupported file type: {suffix}")
+    save(data, str(file_path))
 
 
 def create_zip_from_dict(zip_path: Path, files_dict: Dict[str, Dict[str, Any]]) -> None:
@@ -132,7 +187,7 @@ def load_zip_to_dict(zip_path: Path) -> Dict[str, Dict[str, Any]]:
     
     with zipfile.ZipFile(zip_path, 'r') as zipf:
         for name in zipf.namelist():
-            content = zipf.read(name).decode('utf-8')
-            files_dict[name] = json.loads(content)
+            # json.loads decodes the UTF-8 bytes itself
+            files_dict[name] = json.loads(zipf.read(name))
     
     return files_dict
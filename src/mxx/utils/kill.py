@@ -1,27 +1,51 @@
 """Utility helpers to locate and terminate processes by executable path."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import psutil
 
 
-def _canonical_path(path: str | Path) -> Path:
-	return Path(path).expanduser().resolve()
+def _file_key(path: str | Path):
+	"""Return a key identifying the file at ``path``, or None if it can't be read.
+
+	The key is ``(st_dev, st_ino)`` from a single ``stat``, which follows symlinks
+	and junctions (e.g. Scoop's ``current``) on every platform. File systems that
+	report no inode number fall back to the fully resolved, case-folded path.
+	"""
+
+	path = os.path.expanduser(str(path))
+	try:
+		st = os.stat(path)
+	except (OSError, ValueError):
+		return None
+	if not st.st_ino:
+		return os.path.normcase(os.path.realpath(path))
+	return st.st_dev, st.st_ino
 
 
 def processes_by_path(executable_path: str | Path) -> list[psutil.Process]:
 	"""Return every running process whose executable matches the given path."""
 
-	target = _canonical_path(executable_path)
+	return processes_by_paths([executable_path])
+
+
+def processes_by_paths(executable_paths) -> list[psutil.Process]:
+	"""Return every running process whose executable matches any of the given paths.
+
+	All paths are matched in a single scan of the process table.
+	"""
+
+	targets = {key for key in map(_file_key, executable_paths) if key is not None}
+	if not targets:
+		return []
 	matches: list[psutil.Process] = []
 
 	for proc in psutil.process_iter(["exe"]):
 		try:
 			exe = proc.info.get("exe")
-			if not exe:
-				continue
-			proc_path = Path(exe).resolve()
-			if proc_path == target:
+			if exe and _file_key(exe) in targets:
 				matches.append(proc)
 		except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, OSError):
 			continue
@@ -40,24 +64,51 @@ def kill_processes_by_path(
 		wait_timeout: Seconds to wait after ``terminate`` before forcing ``kill``.
 	"""
 
-	processes = processes_by_path(executable_path)
+	return _terminate(processes_by_path(executable_path), wait_timeout)
+
+
+def kill_processes_by_paths(
+	executable_paths,
+	*,
+	wait_timeout: float = 5.0,
+) -> int:
+	"""Terminate every process whose executable matches any of ``executable_paths``.
+
+	Args:
+		wait_timeout: Seconds to wait after ``terminate`` before forcing ``kill``.
+	"""
+
+	return _terminate(processes_by_paths(executable_paths), wait_timeout)
+
+
+def _signal(proc: psutil.Process, action: str) -> bool:
+	try:
+		getattr(proc, action)()
+		return True
+	except (psutil.NoSuchProcess, psutil.AccessDenied):
+		return False
+
+
+def _signal_all(processes: list[psutil.Process], action: str) -> int:
+	"""Send ``terminate``/``kill`` to every process concurrently; return how many succeeded."""
+
+	if len(processes) == 1:
+		return int(_signal(processes[0], action))
+	with ThreadPoolExecutor(max_workers=min(32, len(processes))) as pool:
+		return sum(pool.map(lambda proc: _signal(proc, action), processes))
+
+
+def _terminate(processes: list[psutil.Process], wait_timeout: float) -> int:
+	"""Terminate the given processes, killing any still alive after ``wait_timeout``."""
+
 	if not processes:
 		return 0
 
-	terminated = 0
-	for proc in processes:
-		try:
-			proc.terminate()
-			terminated += 1
-		except (psutil.NoSuchProcess, psutil.AccessDenied):
-			continue
+	terminated = _signal_all(processes, "terminate")
 
 	_, still_alive = psutil.wait_procs(processes, timeout=wait_timeout)
 
-	for proc in still_alive:
-		try:
-			proc.kill()
-		except (psutil.NoSuchProcess, psutil.AccessDenied):
-			continue
+	if still_alive:
+		_signal_all(still_alive, "kill")
 
 	return terminated
@@ -1,5 +1,6 @@
 """Extract and parse --var arguments from sys.argv before Click processes them."""
 
+import re
 import sys
 from typing import Dict, List, Tuple
 
@@ -7,6 +8,33 @@ from typing import Dict, List, Tuple
 # Global storage for parsed vars
 _parsed_vars: Dict[str, str] = {}
 
+# Matches "--var" (group 1 is None) and "--var=x=y" (group 1 is "x=y")
+_VAR_RE = re.compile(r'--var(?:=(.*))?', re.DOTALL)
+
+
+def _strip(text: str) -> str:
+    """Strip surrounding whitespace, returning text itself when there is none."""
+    if text and (text[0].isspace() or text[-1].isspace()):
+        return text.strip()
+    return text
+
+
+def _parse_var(var_value: str) -> Tuple[str, str]:
+    """Split a single --var value into a key and value.
+    
+    Args:
+        var_value: Raw value such as "x=y" or "x"
+        
+    Returns:
+        Tuple of (key, value); a value without '=' is a boolean flag set to 'true'
+    """
+    key, sep, value = var_value.partition('=')
+    # Keys are interned since the same few names are looked up repeatedly
+    key = sys.intern(_strip(key))
+    if not sep:
+        return key, 'true'
+    return key, _strip(value)
+
 
 def extract_var_args(argv: List[str] = None) -> Tuple[List[str], Dict[str, str]]:
     """Extract --var arguments from sys.argv and parse them.
@@ -35,38 +63,23 @@ def extract_var_args(argv: List[str] = None) -> Tuple[List[str], Dict[str, str]]
     cleaned_argv = []
     vars_dict = {}
     
-    i = 0
-    while i < len(argv):
-        arg = argv[i]
-        
-        if arg == '--var':
-            # Next argument should be the x=y value or just x (bool=true)
-            if i + 1 < len(argv):
-                var_value = argv[i + 1]
-                if '=' in var_value:
-                    key, value = var_value.split('=', 1)
-                    vars_dict[key.strip()] = value.strip()
-                else:
-                    # No '=' means it's a boolean flag, set to 'true'
-                    vars_dict[var_value.strip()] = 'true'
-                i += 2  # Skip both --var and its value
-            else:
-                # --var without value, just skip it
-                i += 1
-        elif arg.startswith('--var='):
-            # Handle --var=x=y or --var=x format
-            var_value = arg[6:]  # Remove '--var=' prefix
-            if '=' in var_value:
-                key, value = var_value.split('=', 1)
-                vars_dict[key.strip()] = value.strip()
-            else:
-                # No '=' means it's a boolean flag, set to 'true'
-                vars_dict[var_value.strip()] = 'true'
-            i += 1
-        else:
+    args = iter(argv)
+    for arg in args:
+        match = _VAR_RE.fullmatch(arg) if arg.startswith('--var') else None
+        if match is None:
             # Keep this argument
             cleaned_argv.append(arg)
-            i += 1
+            continue
+        
+        var_value = match.group(1)
+        if var_value is None:
+            # "--var x=y": the value is the next argument (a trailing
+            # "--var" without value is just dropped)
+            var_value = next(args, None)
+            if var_value is None:
+                break
+        key, value = _parse_var(var_value)
+        vars_dict[key] = value
     
     # Store in global for easy access
     global _parsed_vars
@@ -6,8 +6,8 @@ def save_json(data, filepath):
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 def load_json(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # json.loads detects the UTF encoding of bytes itself, skipping text decoding
+    return json.loads(Path(filepath).read_bytes())
     
 def touch_json(filepath, default={}):
     """Create an empty JSON file if it doesn't exist."""
@@ -1,8 +1,12 @@
 
+import tomllib
+
 import toml
 
 def load_toml(path: str) -> dict:
-    return toml.load(path)
+    # stdlib tomllib parses straight from the binary file object
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
     
 def save_toml(data: dict, path: str) -> None:
     with open(path, 'w', encoding='utf-8') as f:
@@ -1,7 +1,27 @@
 """Pattern matching utilities for config keys with wildcard support."""
 
 import fnmatch
-from typing import List
+import functools
+import os
+import re
+from typing import Callable, List, Optional
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(patterns: tuple[str, ...]) -> Callable[[str], Optional[re.Match]]:
+    """Translate wildcard patterns once into a single regex matcher.
+    
+    Patterns are case-normalized like fnmatch.fnmatch does, so matching
+    stays case-insensitive on Windows.
+    
+    Args:
+        patterns: Patterns with wildcards
+        
+    Returns:
+        The compiled alternation's match method
+    """
+    combined = "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+    return re.compile(combined).match
 
 
 def matches_pattern(key: str, pattern: str) -> bool:
@@ -26,7 +46,7 @@ def matches_pattern(key: str, pattern: str) -> bool:
         >>> matches_pattern("other.key", "wxx*.set*")
         False
     """
-    return fnmatch.fnmatch(key, pattern)
+    return _compile((pattern,))(os.path.normcase(key)) is not None
 
 
 def matches_any_pattern(key: str, patterns: List[str]) -> bool:
@@ -45,7 +65,9 @@ def matches_any_pattern(key: str, patterns: List[str]) -> bool:
         >>> matches_any_pattern("other", ["wxx*", "config*"])
         False
     """
-    return any(matches_pattern(key, pattern) for pattern in patterns)
+    if not patterns:
+        return False
+    return _compile(tuple(patterns))(os.path.normcase(key)) is not None
 
 
 def filter_keys_by_pattern(keys: List[str], pattern: str, exclude: bool = False) -> List[str]:
@@ -65,7 +87,9 @@ def filter_keys_by_pattern(keys: List[str], pattern: str, exclude: bool = False)
         >>> filter_keys_by_pattern(["wxx.a", "wxx.b", "other"], "wxx*", exclude=True)
         ['other']
     """
+    match = _compile((pattern,))
+    normcase = os.path.normcase
     if exclude:
-        return [k for k in keys if not matches_pattern(k, pattern)]
+        return [k for k in keys if match(normcase(k)) is None]
     else:
-        return [k for k in keys if matches_pattern(k, pattern)]
+        return [k for k in keys if match(normcase(k)) is not None]
@@ -9,12 +9,16 @@ import pytest
 from mxx.core.config import get_config_path, get_profile_path
 from mxx.core.model_load import (
     get_all_files,
+    get_all_files_with_stat,
     get_file,
     load_model,
     get_list,
     get_models,
-    _cache
+    preload_files,
+    _cache,
+    _raw_cache
 )
+from mxx.core.profile_resolver import ProfileResolver
 from mxx.models.ld import LDModel
 from mxx.models.maa import MaaModel
 from mxx.models.profile import MxxProfile
@@ -136,11 +140,13 @@ class TestModelLoadFunctions:
         """Set up test environment before each test."""
         # Clear the cache before each test
         _cache.clear()
+        _raw_cache.clear()
         get_config_path.cache_clear()
     
     def teardown_method(self):
         """Clean up after each test."""
         _cache.clear()
+        _raw_cache.clear()
         get_config_path.cache_clear()
     
     def test_get_all_files(self):
@@ -173,6 +179,24 @@ class TestModelLoadFunctions:
                 assert "profile3.maa" in file_dict
                 assert file_dict["profile3.maa"][1] == "maa"
     
+    def test_get_all_files_with_stat(self):
+        """Test that the scandir listing matches get_all_files and adds mtimes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            profiles_dir = config_dir / "configs"
+            profiles_dir.mkdir()
+            
+            (profiles_dir / "profile1.toml").touch()
+            (profiles_dir / "profile2.ld.toml").touch()
+            (profiles_dir / "not_toml.txt").touch()
+            
+            with mock.patch.dict(os.environ, {'MXX_CONFIG_DIR': str(config_dir)}):
+                files = list(get_all_files_with_stat())
+                
+                assert sorted(entry[:3] for entry in files) == sorted(get_all_files())
+                for file, _, _, mtime in files:
+                    assert mtime == file.stat().st_mtime_ns
+    
     def test_get_file_exact_match(self):
         """Test getting a file by exact name match."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -349,6 +373,20 @@ class TestModelLoadFunctions:
                 with pytest.raises(ValueError, match="Template model 'nonexistent_template' not found"):
                     load_model("bad_template")
     
+    def test_load_model_circular_template(self):
+        """Test that a template referring back to itself is reported."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            profiles_dir = config_dir / "configs"
+            profiles_dir.mkdir()
+            
+            save_toml({"maa": {"template": "loop"}}, profiles_dir / "loop.maa.toml")
+            save_toml({"maa": {"template": "loop"}}, profiles_dir / "uses_loop.toml")
+            
+            with mock.patch.dict(os.environ, {'MXX_CONFIG_DIR': str(config_dir)}):
+                with pytest.raises(ValueError, match="Circular template reference 'loop'"):
+                    load_model("uses_loop")
+    
     def test_load_model_template_with_extra_keys(self):
         """Test that loading fails when template definition has extra keys."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -385,6 +423,52 @@ class TestModelLoadFunctions:
                 # Should be the same cached object
                 assert model1 is model2
     
+    def test_preload_files(self):
+        """Test that preloaded files are parsed once and consumed by load_model."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            profiles_dir = config_dir / "configs"
+            profiles_dir.mkdir()
+            
+            save_toml({"name": "device1"}, profiles_dir / "dev1.ld.toml")
+            (profiles_dir / "broken.toml").write_text("not = [valid")
+            
+            with mock.patch.dict(os.environ, {'MXX_CONFIG_DIR': str(config_dir)}):
+                preload_files([file for file, _, _ in get_all_files()])
+                assert set(_raw_cache) == {"dev1.ld", "broken"}
+                
+                model = load_model("dev1.ld")
+                assert isinstance(model, LDModel)
+                assert model.name == "device1"
+                
+                # Parse errors surface when the model is loaded
+                with pytest.raises(Exception):
+                    load_model("broken")
+                
+                assert not _raw_cache
+    
+    def test_file_items_reload_on_change(self):
+        """Test that resolver file items are reused until the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            profiles_dir = config_dir / "configs"
+            profiles_dir.mkdir()
+            
+            file = profiles_dir / "dev.ld.toml"
+            save_toml({"name": "first"}, file)
+            
+            with mock.patch.dict(os.environ, {'MXX_CONFIG_DIR': str(config_dir)}):
+                resolver = ProfileResolver()
+                model1 = resolver.get_file_items()["dev.ld"][0]
+                assert resolver.get_file_items()["dev.ld"][0] is model1
+                
+                save_toml({"name": "second"}, file)
+                mtime = file.stat().st_mtime_ns + 1_000_000_000
+                os.utime(file, ns=(mtime, mtime))
+                
+                model2 = resolver.get_file_items()["dev.ld"][0]
+                assert model2.name == "second"
+    
     def test_load_model_not_found(self):
         """Test that None is returned when model file doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -494,11 +578,13 @@ class TestIntegrationScenarios:
     def setup_method(self):
         """Set up test environment."""
         _cache.clear()
+        _raw_cache.clear()
         get_config_path.cache_clear()
     
     def teardown_method(self):
         """Clean up after tests."""
         _cache.clear()
+        _raw_cache.clear()
         get_config_path.cache_clear()
     
     def test_multiple_profiles_with_shared_templates(self):
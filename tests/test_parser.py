@@ -0,0 +1,75 @@
+"""Test cases for profile validation."""
+
+from pathlib import Path
+
+import pytest
+from mxx.core import parser
+from mxx.core.parser import (
+    ValidationError,
+    get_maa_app_path,
+    get_maa_config_path,
+    validate_maa_model,
+)
+from mxx.models.maa import MaaModel
+
+
+@pytest.fixture(autouse=True)
+def clear_exists_cache():
+    """Start every test with an empty existence cache."""
+    parser._exists_cache.clear()
+    yield
+    parser._exists_cache.clear()
+
+
+class TestValidateMaaModel:
+    """Test MAA model validation against the filesystem."""
+
+    def test_valid_paths(self, tmp_path):
+        """Test that existing path, app and config directory pass."""
+        (tmp_path / "MAA.exe").touch()
+        (tmp_path / "config").mkdir()
+
+        validate_maa_model(MaaModel(path=str(tmp_path), app="MAA.exe", configDir="config"))
+
+    def test_missing_app(self, tmp_path):
+        """Test that a missing executable is reported."""
+        with pytest.raises(ValidationError, match="executable not found"):
+            validate_maa_model(MaaModel(path=str(tmp_path), app="MAA.exe"))
+
+    def test_existence_is_cached(self, tmp_path):
+        """Test that results are reused until the TTL expires."""
+        maa = MaaModel(path=str(tmp_path), app="MAA.exe")
+        with pytest.raises(ValidationError):
+            validate_maa_model(maa)
+
+        (tmp_path / "MAA.exe").touch()
+        with pytest.raises(ValidationError):
+            validate_maa_model(maa)
+
+        parser._exists_cache.clear()
+        validate_maa_model(maa)
+
+
+class TestMaaPaths:
+    """Test the cached MAA path helpers."""
+
+    def test_app_path_reused(self):
+        """Test that the same Path object is returned while fields are unchanged."""
+        maa = MaaModel(path="C:/MAA", app="MAA.exe")
+
+        assert get_maa_app_path(maa) is get_maa_app_path(maa)
+
+    def test_paths_follow_field_changes(self):
+        """Test that rewriting path (as plugins do) rebuilds the cached paths."""
+        maa = MaaModel(path="C:/MAA", app="MAA.exe", configDir="config")
+        get_maa_app_path(maa)
+        get_maa_config_path(maa)
+
+        maa.path = "D:/apps/maa"
+
+        assert get_maa_app_path(maa) == Path("D:/apps/maa") / "MAA.exe"
+        assert get_maa_config_path(maa) == Path("D:/apps/maa") / "config"
+
+    def test_plugin_managed_path_skips_checks(self):
+        """Test that scoop paths are not checked against the filesystem."""
+        validate_maa_model(MaaModel(path="scoop:maa", app="MAA.exe"))
@@ -0,0 +1,486 @@
+"""Test cases for plugin loader hook dispatch."""
+
+from unittest import mock
+import os
+import sys
+import textwrap
+
+import click
+import pytest
+
+from mxx.core.config import get_config_path
+from mxx.plugin_system import interface
+from mxx.plugin_system import loader as loader_module
+from mxx.plugin_system.loader import LazyPlugin, PluginLoader
+from mxx.plugin_system.plugin import MxxPlugin
+
+
+# The real discovery method, before the fixture below patches it out
+_discover_plugins = PluginLoader._discover_plugins
+
+
+@pytest.fixture
+def loader():
+    """Create a fresh loader without discovering installed plugins."""
+    with mock.patch.object(PluginLoader, "_discover_plugins"):
+        yield PluginLoader()
+
+
+class RecordingPlugin(MxxPlugin):
+    """Plugin that records the hooks it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def pre_profile_start(self, profile, ctx):
+        self.calls.append(("pre_profile_start", profile, ctx.get("profile_name")))
+
+    def hook_pre_ld_start(self, profile):
+        self.calls.append(("pre_ld_start", profile))
+
+
+class InitCountingPlugin(MxxPlugin):
+    """Plugin that counts init calls and records the context it got."""
+
+    def __init__(self):
+        super().__init__()
+        self.inits = []
+
+    def init(self, ctx=None):
+        self.inits.append(ctx)
+
+
+class CommandPlugin(MxxPlugin):
+    """Plugin that records the groups it registers commands with."""
+
+    def __init__(self):
+        super().__init__()
+        self.groups = []
+
+    def register_commands(self, cli_group):
+        self.groups.append(cli_group)
+
+
+class ProfilesPlugin(MxxPlugin):
+    """Plugin that provides profiles and counts how often they are built."""
+
+    def __init__(self, names, list_names=True):
+        super().__init__()
+        self.names = names
+        self.list_names = list_names
+        self.builds = 0
+
+    def get_profiles(self):
+        self.builds += 1
+        return {name: f"profile:{name}" for name in self.names}
+
+    def get_profile_names(self):
+        return list(self.names) if self.list_names else None
+
+
+class VetoPlugin(MxxPlugin):
+    """Plugin that blocks every profile."""
+
+    def can_run_profile(self, profile, ctx):
+        return False
+
+
+class TestHookRegistry:
+    """Test the per-hook plugin registry."""
+
+    def test_has_hook_only_for_overridden_methods(self, loader):
+        """Test that only overridden interface methods are registered."""
+        loader.register_plugin(RecordingPlugin())
+
+        assert loader.has_hook("pre_profile_start")
+        assert loader.has_hook("hook_pre_ld_start")
+        assert not loader.has_hook("post_profile_start")
+        assert not loader.has_hook("can_run_profile")
+        assert not loader.has_hook("hook_pre_maa_launch")
+
+    def test_plugins_list_still_populated(self, loader):
+        """Test that registered plugins remain in the plugins list."""
+        plugin = MxxPlugin()
+        loader.register_plugin(plugin)
+
+        assert loader.plugins == [plugin]
+        assert not loader.has_hook("init")
+
+    def test_dispatch_reaches_implementing_plugins(self, loader):
+        """Test that profile hooks and emitted hooks reach implementers."""
+        plugin = RecordingPlugin()
+        loader.register_plugin(plugin)
+        loader.set_context({"profile_name": "daily"})
+
+        loader.pre_profile_start("profile", {})
+        loader.emit("pre_ld_start", "profile")
+        loader.emit("pre_maa_launch", "profile")
+
+        assert plugin.calls == [
+            ("pre_profile_start", "profile", "daily"),
+            ("pre_ld_start", "profile"),
+        ]
+
+    def test_emit_filters_kwargs_with_cached_signature(self, loader):
+        """Test that unknown kwargs are dropped and signatures inspected once."""
+        plugin = RecordingPlugin()
+        loader.register_plugin(plugin)
+
+        with mock.patch.object(interface, "_sig_cache", {}), \
+             mock.patch.object(interface.inspect, "signature", wraps=interface.inspect.signature) as signature:
+            loader.emit("pre_ld_start", "a", vars={"x": "1"})
+            loader.emit("pre_ld_start", "b", vars={"x": "1"})
+
+        assert plugin.calls == [("pre_ld_start", "a"), ("pre_ld_start", "b")]
+        assert signature.call_count == 1
+
+    def test_can_run_profile_without_plugins(self, loader):
+        """Test that profiles can run when no plugin registers a check."""
+        loader.register_plugin(RecordingPlugin())
+
+        assert loader.can_run_profile("profile", {}) is True
+        assert loader.can_kill_profile("profile", {}) is True
+
+    def test_can_run_profile_veto(self, loader):
+        """Test that a registered veto blocks the profile."""
+        loader.register_plugin(VetoPlugin())
+
+        assert loader.can_run_profile("profile", {}) is False
+        assert loader.can_kill_profile("profile", {}) is True
+
+    def test_ensure_init_runs_once(self, loader):
+        """Test that lazy init only initializes plugins the first time."""
+        plugin = InitCountingPlugin()
+        loader.register_plugin(plugin)
+
+        loader.ensure_init("first")
+        loader.ensure_init("second")
+
+        assert plugin.inits == ["first"]
+
+    def test_ensure_commands_runs_once(self, loader):
+        """Test that lazy command registration only happens the first time."""
+        plugin = CommandPlugin()
+        loader.register_plugin(plugin)
+
+        assert loader.ensure_commands("cli") is True
+        assert loader.ensure_commands("cli") is False
+        assert plugin.groups == ["cli"]
+
+    def test_command_manifest_registers_only_owner(self, caplog):
+        """Test that cached command names limit registration to the owning plugin."""
+        class NamedCommandPlugin(MxxPlugin):
+            def __init__(self, name):
+                super().__init__()
+                self.name = name
+                self.calls = 0
+
+            def register_commands(self, cli_group):
+                self.calls += 1
+                cli_group.add_command(click.Command(self.name))
+
+        cache = {"modules": {"mxxp_alpha": {}, "mxxp_run": {}}}
+
+        def make_loader():
+            with mock.patch.object(PluginLoader, "_discover_plugins"):
+                new = PluginLoader()
+            new._discovery_cache = cache
+            for package, command in (("mxxp_alpha", "alpha"), ("mxxp_run", "run")):
+                plugin = NamedCommandPlugin(command)
+                new.register_plugin(plugin)
+                new._plugin_names[plugin] = package
+            return new
+
+        with mock.patch.object(loader_module, "_save_discovery_cache") as save:
+            cold = make_loader()
+            group = click.Group(commands=[click.Command("run")])
+            assert cold.ensure_commands(group, "config")
+            save.assert_called_once()
+        assert cache["modules"]["mxxp_alpha"]["commands"] == ["alpha"]
+        assert "'run' replaces the built-in command" in caplog.text
+
+        warm = make_loader()
+        group = click.Group(commands=[click.Command("run")])
+        assert warm.ensure_commands(group, "alpha")
+        assert [p.calls for p in warm.plugins] == [1, 0]
+        assert not warm.ensure_commands(group, "config")
+
+        assert warm.ensure_commands(group)
+        assert [p.calls for p in warm.plugins] == [1, 1]
+
+    def test_shared_loader_created_once(self):
+        """Test that get_plugin_loader constructs a single shared loader."""
+        with mock.patch.object(loader_module, "_instance", None), \
+             mock.patch.object(PluginLoader, "_discover_plugins") as discover:
+            shared = loader_module.get_plugin_loader()
+
+            assert loader_module.get_plugin_loader() is shared
+            assert loader_module.plugin_loader is shared
+            discover.assert_called_once()
+
+
+    def test_var_keyword_hooks_get_all_kwargs(self, loader):
+        """Test that hooks taking **kwargs receive every keyword argument."""
+        seen = []
+
+        class KwargsPlugin(MxxPlugin):
+            def hook_pre_ld_start(self, profile, **kwargs):
+                seen.append(kwargs)
+
+        loader.register_plugin(KwargsPlugin())
+        loader.emit("pre_ld_start", "profile", vars={"x": "1"}, extra=2)
+
+        assert seen == [{"vars": {"x": "1"}, "extra": 2}]
+
+    def test_failing_hook_not_retried(self, loader):
+        """Test that a TypeError raised inside a hook is reported, not retried."""
+        calls = []
+
+        class BrokenPlugin(MxxPlugin):
+            def hook_pre_ld_start(self, profile):
+                calls.append(profile)
+                raise TypeError("broken")
+
+        loader.register_plugin(BrokenPlugin())
+        loader.emit("pre_ld_start", "profile", vars={})
+
+        assert calls == ["profile"]
+
+    def test_vetoing_check_asked_first(self, loader):
+        """Test that a check hook that vetoed is tried before the others."""
+        allow = mock.Mock(return_value=True)
+
+        class AllowPlugin(MxxPlugin):
+            def can_run_profile(self, profile, ctx):
+                return allow(profile)
+
+        loader.register_plugin(AllowPlugin())
+        loader.register_plugin(VetoPlugin())
+
+        assert loader.can_run_profile("profile", {}) is False
+        assert allow.call_count == 1
+
+        assert loader.can_run_profile("profile", {}) is False
+        assert allow.call_count == 1
+
+
+class TestScopedContext:
+    """Test temporary context overlays."""
+
+    def test_overlay_is_reverted(self, loader):
+        """Test that overlaid keys are restored or removed on exit."""
+        loader.set_context({"vars": {"a": "1"}, "profile_name": "outer"})
+
+        with loader.scoped_context(profile_name="inner", profile_failed=True) as context:
+            assert context["profile_name"] == "inner"
+            assert context["profile_failed"] is True
+
+        assert loader.context == {"vars": {"a": "1"}, "profile_name": "outer"}
+
+    def test_overlay_reverted_on_error(self, loader):
+        """Test that the context is restored when the block raises."""
+        loader.set_context({})
+
+        with pytest.raises(RuntimeError):
+            with loader.scoped_context(profile_name="daily"):
+                raise RuntimeError("boom")
+
+        assert loader.context == {}
+
+
+class TestPluginProfiles:
+    """Test on-demand loading of plugin profiles."""
+
+    def test_get_profile_builds_only_owner(self, loader):
+        """Test that resolving one name only builds the owning plugin's profiles."""
+        daily = ProfilesPlugin(["daily"])
+        weekly = ProfilesPlugin(["weekly"])
+        loader.register_plugin(daily)
+        loader.register_plugin(weekly)
+
+        assert loader.has_profile("weekly")
+        assert not loader.has_profile("missing")
+        assert loader.get_profile("weekly") == "profile:weekly"
+        assert (daily.builds, weekly.builds) == (0, 1)
+
+        assert set(loader.load_plugin_profiles()) == {"daily", "weekly"}
+        assert (daily.builds, weekly.builds) == (1, 1)
+
+    def test_names_fall_back_to_get_profiles(self, loader):
+        """Test that plugins without a name listing are built once for the index."""
+        plugin = ProfilesPlugin(["daily"], list_names=False)
+        loader.register_plugin(plugin)
+
+        assert loader.has_profile("daily")
+        assert loader.get_profile("daily") == "profile:daily"
+        assert plugin.builds == 1
+
+
+class TestDiscoveryCache:
+    """Test the cached plugin discovery scan."""
+
+    def test_scan_skipped_while_search_path_unchanged(self, loader, tmp_path, monkeypatch):
+        """Test that sys.path is only scanned again after it changes."""
+        monkeypatch.setattr(loader_module, "_entry_point_targets", dict)
+        monkeypatch.setenv("MXX_CONFIG_DIR", str(tmp_path))
+        get_config_path.cache_clear()
+        try:
+            with mock.patch.object(loader_module.pkgutil, "iter_modules", return_value=[]) as scan:
+                _discover_plugins(loader)
+                _discover_plugins(loader)
+                assert scan.call_count == 1
+
+                with mock.patch.object(loader_module, "_search_path_stamps", return_value=[["new", 1]]):
+                    _discover_plugins(loader)
+                assert scan.call_count == 2
+        finally:
+            get_config_path.cache_clear()
+
+    def test_cached_plugins_imported_on_first_hook(self, loader, tmp_path, monkeypatch):
+        """Test that unchanged plugins are registered lazily from the cache."""
+        package = tmp_path / "pkgs" / "mxxp_lazy_probe"
+        package.mkdir(parents=True)
+        (package / "__init__.py").touch()
+        (package / "__plugin__.py").write_text(textwrap.dedent("""
+            from mxx.plugin_system import MxxPlugin
+
+            class ProbePlugin(MxxPlugin):
+                calls = []
+
+                def hook_pre_ld_start(self, profile):
+                    self.calls.append(profile)
+
+            plugin = ProbePlugin()
+        """))
+        monkeypatch.syspath_prepend(str(tmp_path / "pkgs"))
+        monkeypatch.setattr(loader_module, "_entry_point_targets", dict)
+        monkeypatch.setenv("MXX_CONFIG_DIR", str(tmp_path / "config"))
+        get_config_path.cache_clear()
+        try:
+            _discover_plugins(loader)
+            assert loader.has_hook("hook_pre_ld_start")
+
+            for module in ("mxxp_lazy_probe", "mxxp_lazy_probe.__plugin__"):
+                monkeypatch.delitem(sys.modules, module)
+            warm = PluginLoader()
+            _discover_plugins(warm)
+
+            lazy = [p for p in warm.plugins if isinstance(p, LazyPlugin) and p.name == "mxxp_lazy_probe"]
+            assert lazy and warm.has_hook("hook_pre_ld_start")
+            assert "mxxp_lazy_probe.__plugin__" not in sys.modules
+
+            warm.emit("pre_ld_start", "profile", vars={})
+            assert sys.modules["mxxp_lazy_probe.__plugin__"].plugin.calls == ["profile"]
+        finally:
+            get_config_path.cache_clear()
+
+    def test_helper_module_change_invalidates_cache(self, loader, tmp_path, monkeypatch, capsys):
+        """Test that editing any file of a plugin package re-imports it."""
+        package = tmp_path / "pkgs" / "mxxp_stamp_probe"
+        package.mkdir(parents=True)
+        (package / "__init__.py").touch()
+        (package / "base.py").write_text("class Hooks:\n    pass\n")
+        (package / "__plugin__.py").write_text(textwrap.dedent("""
+            from mxx.plugin_system import MxxPlugin
+            from mxxp_stamp_probe.base import Hooks
+
+            class ProbePlugin(Hooks, MxxPlugin):
+                pass
+
+            plugin = ProbePlugin()
+        """))
+        monkeypatch.syspath_prepend(str(tmp_path / "pkgs"))
+        monkeypatch.setattr(loader_module, "_entry_point_targets", dict)
+        monkeypatch.setenv("MXX_CONFIG_DIR", str(tmp_path / "config"))
+        get_config_path.cache_clear()
+        modules = ("mxxp_stamp_probe", "mxxp_stamp_probe.base", "mxxp_stamp_probe.__plugin__")
+        try:
+            _discover_plugins(loader)
+            assert not loader.has_hook("hook_pre_ld_start")
+            assert "Loaded plugin: mxxp_stamp_probe" in capsys.readouterr().out
+
+            # Cached and unchanged: registered lazily without claiming a load
+            for module in modules:
+                monkeypatch.delitem(sys.modules, module)
+            _discover_plugins(PluginLoader())
+            assert "Loaded plugin" not in capsys.readouterr().out
+
+            (package / "base.py").write_text(
+                "class Hooks:\n    def hook_pre_ld_start(self, profile):\n        pass\n"
+            )
+            mtime = os.stat(package / "base.py").st_mtime_ns + 10**9
+            os.utime(package / "base.py", ns=(mtime, mtime))
+            for module in modules:
+                sys.modules.pop(module, None)
+            warm = PluginLoader()
+            _discover_plugins(warm)
+
+            assert warm.has_hook("hook_pre_ld_start")
+            assert not any(isinstance(p, LazyPlugin) for p in warm.plugins)
+        finally:
+            get_config_path.cache_clear()
+
+    def test_host_upgrade_invalidates_cached_hooks(self, loader, tmp_path, monkeypatch):
+        """Test that cached hook lists are dropped when mxx itself changes."""
+        package = tmp_path / "pkgs" / "mxxp_header_probe"
+        package.mkdir(parents=True)
+        (package / "__init__.py").touch()
+        (package / "__plugin__.py").write_text(textwrap.dedent("""
+            from mxx.plugin_system import MxxPlugin
+
+            plugin = MxxPlugin()
+        """))
+        monkeypatch.syspath_prepend(str(tmp_path / "pkgs"))
+        monkeypatch.setattr(loader_module, "_entry_point_targets", dict)
+        monkeypatch.setenv("MXX_CONFIG_DIR", str(tmp_path / "config"))
+        get_config_path.cache_clear()
+        try:
+            _discover_plugins(loader)
+
+            warm = PluginLoader()
+            _discover_plugins(warm)
+            assert any(isinstance(p, LazyPlugin) for p in warm.plugins)
+
+            header = dict(loader_module._cache_header(), mxx="99.0")
+            monkeypatch.setattr(loader_module, "_cache_header", lambda: header)
+            upgraded = PluginLoader()
+            _discover_plugins(upgraded)
+            assert not any(isinstance(p, LazyPlugin) for p in upgraded.plugins)
+            assert loader_module._load_discovery_cache()["header"] == header
+        finally:
+            get_config_path.cache_clear()
+
+    def test_entry_points_and_scanned_packages_combined(self, loader, tmp_path, monkeypatch):
+        """Test that entry points load alongside 'mxxp_' packages without one."""
+        source = textwrap.dedent("""
+            from mxx.plugin_system import MxxPlugin
+
+            class ProbePlugin(MxxPlugin):
+                def hook_pre_ld_start(self, profile):
+                    pass
+
+            probe = plugin = ProbePlugin()
+        """)
+        for package, module in (("mxxp_ep_probe", "hooks.py"), ("mxxp_old_probe", "__plugin__.py")):
+            (tmp_path / "pkgs" / package).mkdir(parents=True)
+            (tmp_path / "pkgs" / package / "__init__.py").touch()
+            (tmp_path / "pkgs" / package / module).write_text(source)
+        monkeypatch.syspath_prepend(str(tmp_path / "pkgs"))
+        monkeypatch.setattr(loader_module, "_entry_point_targets",
+                            lambda: {"mxxp_ep_probe": ("mxxp_ep_probe.hooks:probe", "1.0")})
+        monkeypatch.setenv("MXX_CONFIG_DIR", str(tmp_path / "config"))
+        get_config_path.cache_clear()
+        try:
+            _discover_plugins(loader)
+            assert len(loader.plugins) == 2
+
+            warm = PluginLoader()
+            with mock.patch.object(loader_module.pkgutil, "iter_modules") as scan:
+                _discover_plugins(warm)
+            scan.assert_not_called()
+
+            targets = sorted(p.target for p in warm.plugins if isinstance(p, LazyPlugin))
+            assert targets == ["mxxp_ep_probe.hooks:probe", "mxxp_old_probe.__plugin__:plugin"]
+        finally:
+            get_config_path.cache_clear()
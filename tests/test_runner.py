@@ -0,0 +1,66 @@
+"""Test cases for the profile runner."""
+
+import subprocess
+from unittest import mock
+
+from mxx.core.runner import ProfileRunner, _ld_is_ready, _wait_for_ld_ready
+from mxx.models.ld import LDModel
+from mxx.models.maa import MaaModel
+from mxx.models.profile import MxxProfile
+
+
+LIST2_OUTPUT = "0,LDPlayer,0,0,1,1234,5678\n1,farm,0,0,0,2345,6789\n"
+
+
+def _list2(stdout=LIST2_OUTPUT):
+    """Patch subprocess.run to return the given ldpx console list2 output."""
+    return mock.patch.object(
+        subprocess, "run",
+        return_value=subprocess.CompletedProcess([], 0, stdout=stdout, stderr=""),
+    )
+
+
+class TestLdReady:
+    """Test LD readiness polling."""
+
+    def test_ready_by_index_and_name(self):
+        """Test that the android_started column is read for the matching row."""
+        with _list2():
+            assert _ld_is_ready(LDModel(index=0))
+            assert not _ld_is_ready(LDModel(name="farm"))
+            assert not _ld_is_ready(LDModel(name="missing"))
+
+    def test_ldpx_missing(self):
+        """Test that a missing ldpx counts as not ready."""
+        with mock.patch.object(subprocess, "run", side_effect=FileNotFoundError):
+            assert not _ld_is_ready(LDModel(index=0))
+
+    def test_wait_returns_once_ready(self):
+        """Test that waiting stops at the first ready check."""
+        with _list2() as run, mock.patch("mxx.core.runner.time.sleep") as sleep:
+            assert _wait_for_ld_ready(LDModel(index=0), timeout=15)
+
+        assert run.call_count == 1
+        sleep.assert_not_called()
+
+    def test_wait_times_out(self):
+        """Test that waiting gives up after the timeout."""
+        with _list2():
+            assert not _wait_for_ld_ready(LDModel(name="farm"), timeout=0)
+
+
+class TestStartProfile:
+    """Test starting profiles."""
+
+    def test_missing_ldpx_still_launches_maa(self, capsys):
+        """Test that a missing ldpx warns and MAA is launched after the wait."""
+        profile = MxxProfile(ld=LDModel(index=0), maa=MaaModel(path="C:/MAA", app="MAA.exe"))
+
+        with mock.patch("shutil.which", return_value=None), \
+             mock.patch("mxx.core.runner._wait_for_ld_ready", return_value=False) as wait, \
+             mock.patch("mxx.utils.nofuss.subprocess.launch_detached") as launch:
+            assert ProfileRunner().start_profile(profile, wait_time=3, validate=False)
+
+        wait.assert_called_once()
+        launch.assert_called_once()
+        assert "ldpx not found" in capsys.readouterr().out
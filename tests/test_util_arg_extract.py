@@ -0,0 +1,31 @@
+"""Test cases for --var argument extraction."""
+
+from mxx.utils.nofuss.arg_extract import extract_var_args
+
+
+class TestExtractVarArgs:
+    """Test the extract_var_args function."""
+
+    def test_separate_values(self):
+        """Test --var followed by its value as the next argument."""
+        argv = ['mxx', 'run', 'up', '--var', 'x=1', '--var', 'y=2', 'profile']
+
+        assert extract_var_args(argv) == (['mxx', 'run', 'up', 'profile'], {'x': '1', 'y': '2'})
+
+    def test_inline_values(self):
+        """Test --var=x=y form and values containing '='."""
+        argv = ['mxx', '--var=x=1', '--var', 'url=a=b']
+
+        assert extract_var_args(argv) == (['mxx'], {'x': '1', 'url': 'a=b'})
+
+    def test_boolean_flags(self):
+        """Test that values without '=' become 'true'."""
+        argv = ['mxx', '--var', 'debug', '--var=quiet']
+
+        assert extract_var_args(argv) == (['mxx'], {'debug': 'true', 'quiet': 'true'})
+
+    def test_other_arguments_kept(self):
+        """Test that similar-looking options and a dangling --var are handled."""
+        argv = ['mxx', '--variable', 'p', '--var']
+
+        assert extract_var_args(argv) == (['mxx', '--variable', 'p'], {})
@@ -91,6 +91,26 @@ class TestFilterFiles:
             # Filter should find both files
             files = filter_files(tmppath, include_patterns=["*.toml"])
             assert len(files) == 2
+    
+    def test_filter_name_and_path_patterns(self):
+        """Test that patterns match nested files by bare name or relative path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            
+            (tmppath / "keep.toml").touch()
+            subdir = tmppath / "sub"
+            subdir.mkdir()
+            (subdir / "keep.toml").touch()
+            (subdir / "other.toml").touch()
+            (subdir / "skip.json").touch()
+            
+            files = filter_files(tmppath, include_patterns=["keep.toml", "sub/*.json"])
+            names = sorted(f.relative_to(tmppath).as_posix() for f in files)
+            assert names == ["keep.toml", "sub/keep.toml", "sub/skip.json"]
+            
+            files = filter_files(tmppath, exclude_patterns=["keep.toml"])
+            names = sorted(f.relative_to(tmppath).as_posix() for f in files)
+            assert names == ["sub/other.toml", "sub/skip.json"]
 
 
 class TestConfigFileOperations:
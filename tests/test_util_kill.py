@@ -0,0 +1,45 @@
+"""Test cases for process lookup by executable path."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from mxx.utils.kill import _file_key, processes_by_path
+
+
+def _symlink(target, link):
+    """Create a symlink or skip the test where that isn't permitted."""
+    try:
+        os.symlink(target, link)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+
+class TestProcessesByPath:
+    """Test matching processes against executable paths."""
+
+    def test_symlink_matches_target(self, tmp_path):
+        """Test that a symlinked path identifies the same file as its target."""
+        target = tmp_path / "app.exe"
+        target.touch()
+        link = tmp_path / "current.exe"
+        _symlink(target, link)
+
+        assert _file_key(link) == _file_key(target)
+        assert _file_key(tmp_path / "missing.exe") is None
+
+    def test_process_found_through_symlink(self, tmp_path):
+        """Test that a process is found via a symlink to its executable."""
+        link = tmp_path / "python"
+        _symlink(os.path.realpath(sys.executable), link)
+
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            time.sleep(0.2)
+            assert proc.pid in [p.pid for p in processes_by_path(link)]
+        finally:
+            proc.kill()
+            proc.wait()